@@ -32,6 +32,9 @@ def _rewrite_file(filename: str) -> int:
     for i, tok in reversed_enumerate(tokens):
         if tok.line in lines_to_remove:
             tokens.pop(i)
+        elif tok.name == 'STRING' and tok.src.endswith(('"""', "'''")):
+            # unasync does not touch strings, so rewrite the examples in docstrings here
+            tokens[i] = tok._replace(src=tok.src.replace('async with ', 'with ').replace('await ', ''))
     new_contents = tokens_to_src(tokens)
     if new_contents != contents:
         with open(filename, 'w') as f:
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-import asyncio
+import asyncio  # unasync: remove
+import functools
 import sys
 import time
 import warnings
+from contextlib import asynccontextmanager
 from typing import Any
+from typing import AsyncIterator
 from typing import Awaitable
 from typing import Callable
 from typing import Coroutine
@@ -40,10 +43,8 @@ sleep = time.sleep
 AsyncFilterFunc: TypeAlias = Callable[[AsyncWindow], Awaitable[bool]]  # unasync: remove
 SyncFilterFunc: TypeAlias = Callable[[AsyncWindow], bool]
 
-CoordModeTargets: TypeAlias = Union[
-    Literal['ToolTip'], Literal['Pixel'], Literal['Mouse'], Literal['Caret'], Literal['Menu']
-]
-CoordModeRelativeTo: TypeAlias = Union[Literal['Screen', 'Relative', 'Window', 'Client', '']]
+CoordModeTargets: TypeAlias = Literal['ToolTip', 'Pixel', 'Mouse', 'Caret', 'Menu']
+CoordModeRelativeTo: TypeAlias = Literal['Screen', 'Relative', 'Window', 'Client', '']
 
 CoordMode: TypeAlias = Union[CoordModeTargets, Tuple[CoordModeTargets, CoordModeRelativeTo]]
 
@@ -54,6 +55,28 @@ TitleMatchMode: TypeAlias = Optional[
     Union[MatchModes, MatchSpeeds, Tuple[Union[MatchModes, MatchSpeeds], Union[MatchSpeeds, MatchModes]]]
 ]
 
+_DHW_MAP: Dict[Optional[bool], str] = {True: 'On', False: 'Off', None: ''}
+
+# suffix for the default (None, None) window query settings; both defaults are valid, so nothing needs checking
+_EMPTY_SUFFIX: Tuple[str, str, str] = ('', '', '')
+
+_TMM_MAP: Dict[Union[MatchModes, MatchSpeeds], Tuple[str, str]] = {
+    1: ('1', ''),
+    2: ('2', ''),
+    3: ('3', ''),
+    'RegEx': ('RegEx', ''),
+    'Fast': ('', 'Fast'),
+    'Slow': ('', 'Slow'),
+}
+
+# KeyWait options keyed by (released, logical_state)
+_KEY_WAIT_OPTIONS: Dict[Tuple[bool, bool], str] = {
+    (False, False): 'D',
+    (False, True): 'DL',
+    (True, False): '',
+    (True, True): 'L',
+}
+
 _BUTTONS: dict[Union[str, int], str] = {
     1: 'L',
     2: 'R',
@@ -96,6 +119,96 @@ SyncPropertyReturnOptionalAsyncWindow: TypeAlias = Optional[AsyncWindow]
 _PROPERTY_DEPRECATION_WARNING_MESSAGE = 'Use of the {0} property is not recommended (in the async API only) and may be removed in a future version. Use the get_{0} method instead'
 
 
+def _resolve_title_match_mode(title_match_mode: TitleMatchMode) -> Tuple[str, str]:
+    """
+    Resolve a title match mode argument to the (match mode, match speed) strings passed to AHK
+    """
+    if isinstance(title_match_mode, tuple):
+        match_mode, match_speed = title_match_mode
+        return str(match_mode), str(match_speed)
+    try:
+        return _TMM_MAP[title_match_mode]  # type: ignore[index]
+    except (KeyError, TypeError):
+        raise ValueError(
+            f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
+        ) from None
+
+
+def _build_window_query_suffix(
+    detect_hidden_windows: Optional[bool], title_match_mode: Optional[TitleMatchMode]
+) -> Tuple[str, str, str]:
+    if title_match_mode is not None:
+        match_mode, match_speed = _resolve_title_match_mode(title_match_mode)
+    else:
+        match_mode = match_speed = ''
+    return _DHW_MAP[detect_hidden_windows], match_mode, match_speed
+
+
+# typed, so that equal values of different types (1 and True) do not share an entry
+_cached_window_query_suffix = functools.lru_cache(maxsize=64, typed=True)(_build_window_query_suffix)
+
+
+def _window_query_suffix(
+    detect_hidden_windows: Optional[bool], title_match_mode: Optional[TitleMatchMode]
+) -> Tuple[str, str, str]:
+    """
+    Build the detect_hidden_windows, match mode and match speed arguments expected by AHK window functions
+
+    Arguments are checked before the cache is consulted, so invalid values always raise. Tuples are not cached:
+    the cache only tells apart the types of the arguments themselves, not of a tuple's items.
+    """
+    if detect_hidden_windows is None and title_match_mode is None:
+        return _EMPTY_SUFFIX
+    if detect_hidden_windows is not None and not isinstance(detect_hidden_windows, bool):
+        raise TypeError(
+            f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
+        )
+    if title_match_mode is None or isinstance(title_match_mode, (int, str)):
+        return _cached_window_query_suffix(detect_hidden_windows, title_match_mode)
+    return _build_window_query_suffix(detect_hidden_windows, title_match_mode)
+
+
+@functools.lru_cache(maxsize=256)
+def _key_from_name(key_name: str) -> Key:
+    """
+    Return a shared Key for a key name. Keys are never mutated, so the same instance can be reused across calls
+    """
+    return Key(key_name=key_name)
+
+
+@functools.lru_cache(maxsize=128, typed=True)
+def _image_search_options(
+    icon: Optional[int],
+    color_variation: Optional[int],
+    transparent: Optional[str],
+    scale_width: Optional[int],
+    scale_height: Optional[int],
+) -> str:
+    """
+    Build the '*option ' prefix that ImageSearch expects before the image path
+
+    Searches are often repeated in a polling loop with the same options, so results are cached (typed, since
+    equal values such as 2 and 2.0 or 1 and True format differently).
+    """
+    if scale_height and not scale_width:
+        scale_width = -1
+    elif scale_width and not scale_height:
+        scale_height = -1
+
+    options: List[Union[str, int]] = []
+    if icon:
+        options.append(f'Icon{icon}')
+    if color_variation is not None:
+        options.append(color_variation)
+    if transparent is not None:
+        options.append(f'Trans{transparent}')
+    if scale_width:
+        options.append(f'w{scale_width}')
+        options.append(f'h{scale_height}')
+    return ''.join([f'*{opt} ' for opt in options])
+
+
+@functools.lru_cache(maxsize=128)
 def resolve_button(button: Union[str, int]) -> str:
     """
     Resolve a string of a button name to a canonical name used for AHK script
@@ -131,6 +244,7 @@ class AsyncAHK:
         assert TransportClass is not None
         transport = TransportClass(**transport_options)
         self._transport: AsyncTransport = transport
+        self._call = transport.function_call
 
     def __getattr__(self, item: Any) -> Any:
         deprecation_replacements: Dict[str, Any] = {'type': self.send_input}
@@ -182,6 +296,28 @@ class AsyncAHK:
                 warnings.warn(warning.message, warning.category, stacklevel=2)
         return None
 
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[None]:
+        """
+        Send calls made with `blocking=False` inside the block to the AHK process together when the block exits.
+
+        Instead of starting a separate AHK process for each non-blocking call, queued calls are written to the
+        AHK process in one go and their responses read back in order. The returned futures resolve once the
+        block exits (or when a blocking call inside the block sends the calls queued before it).
+
+        Unlike normal non-blocking calls, batched calls run in the same AHK process as blocking calls, so they
+        are affected by settings like `set_title_match_mode`.
+
+        Example::
+
+            async with ahk.batch():
+                pid = await ahk.win_get_pid(title='Untitled - Notepad', blocking=False)
+                name = await ahk.win_get_process_name(title='Untitled - Notepad', blocking=False)
+            print(await pid.result(), await name.result())
+        """
+        async with self._transport.batch():
+            yield
+
     async def set_title_match_mode(self, title_match_mode: TitleMatchMode, /) -> None:
         """
         Sets the default title match mode
@@ -196,22 +332,8 @@ class AsyncAHK:
         :return: None
         """
 
-        args = []
-        if isinstance(title_match_mode, tuple):
-            (match_mode, match_speed) = title_match_mode
-        elif title_match_mode in (1, 2, 3, 'RegEx'):
-            match_mode = title_match_mode
-            match_speed = ''
-        elif title_match_mode in ('Fast', 'Slow'):
-            match_mode = ''
-            match_speed = title_match_mode
-        else:
-            raise ValueError(
-                f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-            )
-        args.append(str(match_mode))
-        args.append(str(match_speed))
-        await self._transport.function_call('AHKSetTitleMatchMode', args)
+        args = list(_resolve_title_match_mode(title_match_mode))
+        await self._call('AHKSetTitleMatchMode', args)
         return None
 
     async def get_title_match_mode(self) -> str:
@@ -221,7 +343,7 @@ class AsyncAHK:
         I.E. the current value of `A_TitleMatchMode`
 
         """
-        resp = await self._transport.function_call('AHKGetTitleMatchMode')
+        resp = await self._call('AHKGetTitleMatchMode')
         return resp
 
     async def get_title_match_speed(self) -> str:
@@ -231,17 +353,17 @@ class AsyncAHK:
         I.E. the current value of `A_TitleMatchModeSpeed`
 
         """
-        resp = await self._transport.function_call('AHKGetTitleMatchSpeed')
+        resp = await self._call('AHKGetTitleMatchSpeed')
         return resp
 
     async def set_coord_mode(self, target: CoordModeTargets, relative_to: CoordModeRelativeTo = 'Screen') -> None:
         args = [str(target), str(relative_to)]
-        await self._transport.function_call('AHKSetCoordMode', args)
+        await self._call('AHKSetCoordMode', args)
         return None
 
     async def get_coord_mode(self, target: CoordModeTargets) -> str:
         args = [str(target)]
-        resp = await self._transport.function_call('AHKGetCoordMode', args)
+        resp = await self._call('AHKGetCoordMode', args)
         return resp
 
     # fmt: off
@@ -269,37 +391,9 @@ class AsyncAHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[None, AsyncFutureResult[None]]:
-        args = [control, title, text, str(button), str(click_count), options, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = await self._transport.function_call('AHKControlClick', args=args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (control, title, text, str(button), str(click_count), options, exclude_title, exclude_text, *suffix)
+        resp = await self._call('AHKControlClick', args=args, blocking=blocking)
 
         return resp
 
@@ -325,37 +419,9 @@ class AsyncAHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[str, AsyncFutureResult[str]]:
-        args = [control, title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = await self._transport.function_call('AHKControlGetText', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (control, title, text, exclude_title, exclude_text, *suffix)
+        resp = await self._call('AHKControlGetText', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -380,38 +446,10 @@ class AsyncAHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[Position, AsyncFutureResult[Position]]:
-        args = [control, title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (control, title, text, exclude_title, exclude_text, *suffix)
 
-        resp = await self._transport.function_call('AHKControlGetPos', args, blocking=blocking)
+        resp = await self._call('AHKControlGetPos', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -453,37 +491,9 @@ class AsyncAHK:
         :param blocking:
         :return:
         """
-        args = [control, keys, title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = await self._transport.function_call('AHKControlSend', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (control, keys, title, text, exclude_title, exclude_text, *suffix)
+        resp = await self._call('AHKControlSend', args, blocking=blocking)
         return resp
 
     def start_hotkeys(self) -> None:
@@ -515,7 +525,7 @@ class AsyncAHK:
             args.append('On')
         else:
             args.append('Off')
-        await self._transport.function_call('AHKSetDetectHiddenWindows', args=args)
+        await self._call('AHKSetDetectHiddenWindows', args=args)
         return None
 
     # fmt: off
@@ -539,37 +549,9 @@ class AsyncAHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[List[AsyncWindow], AsyncFutureResult[List[AsyncWindow]]]:
-        args = [title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = await self._transport.function_call('AHKWindowList', args, engine=self, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (title, text, exclude_title, exclude_text, *suffix)
+        resp = await self._call('AHKWindowList', args, engine=self, blocking=blocking)
         return resp
 
     # fmt: off
@@ -585,7 +567,7 @@ class AsyncAHK:
     async def get_mouse_position(
         self, *, blocking: bool = True
     ) -> Union[Tuple[int, int], AsyncFutureResult[Tuple[int, int]]]:
-        resp = await self._transport.function_call('AHKMouseGetPos', blocking=blocking)
+        resp = await self._call('AHKMouseGetPos', blocking=blocking)
         return resp
 
     @property
@@ -614,20 +596,18 @@ class AsyncAHK:
         relative: bool = False,
         blocking: bool = True,
     ) -> Union[None, AsyncFutureResult[None]]:
-        if relative and (x is None or y is None):
-            x = x or 0
-            y = y or 0
-        elif not relative and (x is None or y is None):
-            posx, posy = await self.get_mouse_position()
-            x = x or posx
-            y = y or posy
-
+        if relative:
+            if x is None:
+                x = 0
+            if y is None:
+                y = 0
+        # an omitted absolute coordinate is filled in from the current cursor position by the daemon
         if speed is None:
             speed = 2
-        args = [str(x), str(y), str(speed)]
+        args = ['' if x is None else str(x), '' if y is None else str(y), str(speed)]
         if relative:
             args.append('R')
-        resp = await self._transport.function_call('AHKMouseMove', args, blocking=blocking)
+        resp = await self._call('AHKMouseMove', args, blocking=blocking)
         return resp
 
     async def a_run_script(self, script_text: str, decode: bool = True, blocking: bool = True, **runkwargs: Any) -> str:
@@ -758,8 +738,8 @@ class AsyncAHK:
         self, class_name: str, exact: Optional[bool] = None, title_match_mode: Optional[TitleMatchMode] = None
     ) -> Optional[AsyncWindow]:
         with warnings.catch_warnings(record=True) as caught_warnings:
-            windows = await self.find_windows_by_class(
-                class_name=class_name, exact=exact, title_match_mode=title_match_mode
+            windows = await self.find_windows(
+                title=f'ahk_class {class_name}', title_match_mode=title_match_mode, exact=exact
             )
         if caught_warnings:
             for warning in caught_warnings:
@@ -801,12 +781,8 @@ class AsyncAHK:
     # fmt: on
     async def key_down(self, key: Union[str, Key], *, blocking: bool = True) -> Union[None, AsyncFutureResult[None]]:
         if isinstance(key, str):
-            key = Key(key_name=key)
-        if blocking:
-            await self.send_input(key.DOWN, blocking=True)
-            return None
-        else:
-            return await self.send_input(key.DOWN, blocking=False)
+            key = _key_from_name(key)
+        return await self._call('AHKSendInput', (key.DOWN,), blocking=blocking)
 
     # fmt: off
     @overload
@@ -821,16 +797,10 @@ class AsyncAHK:
     async def key_press(
         self, key: Union[str, Key], *, release: bool = True, blocking: bool = True
     ) -> Union[None, AsyncFutureResult[None]]:
-        if blocking:
-            await self.key_down(key, blocking=True)
-            if release:
-                await self.key_up(key, blocking=True)
-            return None
-        else:
-            d = await self.key_down(key, blocking=False)
-            if release:
-                return await self.key_up(key, blocking=False)
-            return d
+        d = await self.key_down(key, blocking=blocking)
+        if release:
+            return await self.key_up(key, blocking=blocking)
+        return d
 
     # fmt: off
     @overload
@@ -843,13 +813,9 @@ class AsyncAHK:
     async def key_release(self, key: Union[str, Key], *, blocking: bool = True) -> Union[None, AsyncFutureResult[None]]: ...
     # fmt: on
     async def key_release(self, key: Union[str, Key], *, blocking: bool = True) -> Union[None, AsyncFutureResult[None]]:
-        if blocking:
-            await self.key_up(key=key, blocking=True)
-            return None
-        else:
-            return await self.key_up(key=key, blocking=False)
+        return await self.key_up(key=key, blocking=blocking)
 
-    async def key_state(self, key_name: str, mode: Optional[Union[Literal['P'], Literal['T']]] = None) -> bool:
+    async def key_state(self, key_name: str, mode: Optional[Literal['P', 'T']] = None) -> bool:
         raise NotImplementedError()
 
     # fmt: off
@@ -864,12 +830,8 @@ class AsyncAHK:
     # fmt: on
     async def key_up(self, key: Union[str, Key], blocking: bool = True) -> Union[None, AsyncFutureResult[None]]:
         if isinstance(key, str):
-            key = Key(key_name=key)
-        if blocking:
-            await self.send_input(key.UP, blocking=True)
-            return None
-        else:
-            return await self.send_input(key.UP, blocking=False)
+            key = _key_from_name(key)
+        return await self._call('AHKSendInput', (key.UP,), blocking=blocking)
 
     # fmt: off
     @overload
@@ -890,18 +852,12 @@ class AsyncAHK:
         released: bool = False,
         blocking: bool = True,
     ) -> Union[int, AsyncFutureResult[int]]:
-        options = ''
-        if not released:
-            options += 'D'
-        if logical_state:
-            options += 'L'
+        options = _KEY_WAIT_OPTIONS[bool(released), bool(logical_state)]
         if timeout:
-            options += f'T{timeout}'
-        args = [key_name]
-        if options:
-            args.append(options)
+            options = f'{options}T{timeout}'
+        args = (key_name, options) if options else (key_name,)
 
-        resp = await self._transport.function_call('AHKKeyWait', args)
+        resp = await self._call('AHKKeyWait', args, blocking=blocking)
         return resp
 
     async def run_script(self, script_text: str, decode: bool = True, blocking: bool = True, **runkwargs: Any) -> str:
@@ -937,10 +893,10 @@ class AsyncAHK:
             args.append('')
 
         if raw:
-            raw_resp = await self._transport.function_call('AHKSendRaw', args=args, blocking=blocking)
+            raw_resp = await self._call('AHKSendRaw', args=args, blocking=blocking)
             return raw_resp
         else:
-            resp = await self._transport.function_call('AHKSend', args=args, blocking=blocking)
+            resp = await self._call('AHKSend', args=args, blocking=blocking)
             return resp
 
     # fmt: off
@@ -978,7 +934,7 @@ class AsyncAHK:
     # fmt: on
     async def send_input(self, s: str, *, blocking: bool = True) -> Union[None, AsyncFutureResult[None]]:
         args = [s]
-        resp = await self._transport.function_call('AHKSendInput', args, blocking=blocking)
+        resp = await self._call('AHKSendInput', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -1009,12 +965,10 @@ class AsyncAHK:
         else:
             args.append('')
 
-        resp = await self._transport.function_call('AHKSendPlay', args=args, blocking=blocking)
+        resp = await self._call('AHKSendPlay', args=args, blocking=blocking)
         return resp
 
-    async def set_capslock_state(
-        self, state: Optional[Union[Literal['On'], Literal['Off'], Literal['AlwaysOn'], Literal['AlwaysOff']]] = None
-    ) -> None:
+    async def set_capslock_state(self, state: Optional[Literal['On', 'Off', 'AlwaysOn', 'AlwaysOff']] = None) -> None:
         raise NotImplementedError()
 
     async def set_volume(self, value: int, device_number: int = 1) -> None:
@@ -1109,37 +1063,9 @@ class AsyncAHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[AsyncWindow, None, AsyncFutureResult[Union[None, AsyncWindow]]]:
-        args = [title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = await self._transport.function_call('AHKWinGetID', args, blocking=blocking, engine=self)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (title, text, exclude_title, exclude_text, *suffix)
+        resp = await self._call('AHKWinGetID', args, blocking=blocking, engine=self)
         return resp
 
     # fmt: off
@@ -1163,37 +1089,9 @@ class AsyncAHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[str, AsyncFutureResult[str]]:
-        args = [title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = await self._transport.function_call('AHKWinGetText', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (title, text, exclude_title, exclude_text, *suffix)
+        resp = await self._call('AHKWinGetText', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -1217,37 +1115,9 @@ class AsyncAHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[str, AsyncFutureResult[str]]:
-        args = [title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = await self._transport.function_call('AHKWinGetTitle', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (title, text, exclude_title, exclude_text, *suffix)
+        resp = await self._call('AHKWinGetTitle', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -1271,37 +1141,9 @@ class AsyncAHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[Position, None, AsyncFutureResult[Union[Position, None]]]:
-        args = [title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = await self._transport.function_call('AHKWinGetPos', args, blocking=blocking, engine=self)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (title, text, exclude_title, exclude_text, *suffix)
+        resp = await self._call('AHKWinGetPos', args, blocking=blocking, engine=self)
         return resp
 
     # fmt: off
@@ -1325,37 +1167,9 @@ class AsyncAHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[AsyncWindow, None, AsyncFutureResult[Union[AsyncWindow, None]]]:
-        args = [title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = await self._transport.function_call('AHKWinGetIDLast', args, blocking=blocking, engine=self)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (title, text, exclude_title, exclude_text, *suffix)
+        resp = await self._call('AHKWinGetIDLast', args, blocking=blocking, engine=self)
         return resp
 
     # fmt: off
@@ -1379,37 +1193,9 @@ class AsyncAHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[int, None, AsyncFutureResult[Union[int, None]]]:
-        args = [title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = await self._transport.function_call('AHKWinGetPID', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (title, text, exclude_title, exclude_text, *suffix)
+        resp = await self._call('AHKWinGetPID', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -1433,37 +1219,9 @@ class AsyncAHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[None, str, AsyncFutureResult[Optional[str]]]:
-        args = [title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = await self._transport.function_call('AHKWinGetProcessName', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (title, text, exclude_title, exclude_text, *suffix)
+        resp = await self._call('AHKWinGetProcessName', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -1487,37 +1245,9 @@ class AsyncAHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[str, None, Union[None, str, AsyncFutureResult[Optional[str]]]]:
-        args = [title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = await self._transport.function_call('AHKWinGetProcessPath', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (title, text, exclude_title, exclude_text, *suffix)
+        resp = await self._call('AHKWinGetProcessPath', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -1541,37 +1271,9 @@ class AsyncAHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[int, AsyncFutureResult[int]]:
-        args = [title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = await self._transport.function_call('AHKWinGetCount', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (title, text, exclude_title, exclude_text, *suffix)
+        resp = await self._call('AHKWinGetCount', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -1595,37 +1297,9 @@ class AsyncAHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[None, int, AsyncFutureResult[Optional[int]]]:
-        args = [title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = await self._transport.function_call('AHKWinGetMinMax', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (title, text, exclude_title, exclude_text, *suffix)
+        resp = await self._call('AHKWinGetMinMax', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -1649,37 +1323,9 @@ class AsyncAHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[List[AsyncControl], None, AsyncFutureResult[Optional[List[AsyncControl]]]]:
-        args = [title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = await self._transport.function_call('AHKWinGetControlList', args, blocking=blocking, engine=self)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (title, text, exclude_title, exclude_text, *suffix)
+        resp = await self._call('AHKWinGetControlList', args, blocking=blocking, engine=self)
         return resp
 
     # fmt: off
@@ -1718,37 +1364,9 @@ class AsyncAHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[bool, AsyncFutureResult[bool]]:
-        args = [title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = await self._transport.function_call('AHKWinExist', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (title, text, exclude_title, exclude_text, *suffix)
+        resp = await self._call('AHKWinExist', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -1773,37 +1391,9 @@ class AsyncAHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[None, AsyncFutureResult[None]]:
-        args = [new_title, title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = await self._transport.function_call('AHKWinSetTitle', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (new_title, title, text, exclude_title, exclude_text, *suffix)
+        resp = await self._call('AHKWinSetTitle', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -1828,37 +1418,9 @@ class AsyncAHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[None, AsyncFutureResult[None]]:
-        args = [str(toggle), title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = await self._transport.function_call('AHKWinSetAlwaysOnTop', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (str(toggle), title, text, exclude_title, exclude_text, *suffix)
+        resp = await self._call('AHKWinSetAlwaysOnTop', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -1882,37 +1444,9 @@ class AsyncAHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[None, AsyncFutureResult[None]]:
-        args = [title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = await self._transport.function_call('AHKWinSetBottom', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (title, text, exclude_title, exclude_text, *suffix)
+        resp = await self._call('AHKWinSetBottom', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -1936,37 +1470,9 @@ class AsyncAHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[None, AsyncFutureResult[None]]:
-        args = [title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = await self._transport.function_call('AHKWinSetTop', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (title, text, exclude_title, exclude_text, *suffix)
+        resp = await self._call('AHKWinSetTop', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -1990,37 +1496,9 @@ class AsyncAHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[None, AsyncFutureResult[None]]:
-        args = [title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = await self._transport.function_call('AHKWinSetDisable', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (title, text, exclude_title, exclude_text, *suffix)
+        resp = await self._call('AHKWinSetDisable', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -2044,37 +1522,9 @@ class AsyncAHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[None, AsyncFutureResult[None]]:
-        args = [title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = await self._transport.function_call('AHKWinSetEnable', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (title, text, exclude_title, exclude_text, *suffix)
+        resp = await self._call('AHKWinSetEnable', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -2098,37 +1548,9 @@ class AsyncAHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[None, AsyncFutureResult[None]]:
-        args = [title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = await self._transport.function_call('AHKWinSetRedraw', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (title, text, exclude_title, exclude_text, *suffix)
+        resp = await self._call('AHKWinSetRedraw', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -2153,37 +1575,9 @@ class AsyncAHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[bool, AsyncFutureResult[bool]]:
-        args = [style, title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = await self._transport.function_call('AHKWinSetStyle', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (style, title, text, exclude_title, exclude_text, *suffix)
+        resp = await self._call('AHKWinSetStyle', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -2208,37 +1602,9 @@ class AsyncAHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[bool, AsyncFutureResult[bool]]:
-        args = [style, title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = await self._transport.function_call('AHKWinSetExStyle', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (style, title, text, exclude_title, exclude_text, *suffix)
+        resp = await self._call('AHKWinSetExStyle', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -2263,37 +1629,9 @@ class AsyncAHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[bool, AsyncFutureResult[bool]]:
-        args = [options, title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = await self._transport.function_call('AHKWinSetRegion', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (options, title, text, exclude_title, exclude_text, *suffix)
+        resp = await self._call('AHKWinSetRegion', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -2318,37 +1656,9 @@ class AsyncAHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[None, AsyncFutureResult[None]]:
-        args = [str(transparency), title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = await self._transport.function_call('AHKWinSetTransparent', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (str(transparency), title, text, exclude_title, exclude_text, *suffix)
+        resp = await self._call('AHKWinSetTransparent', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -2373,37 +1683,9 @@ class AsyncAHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[None, AsyncFutureResult[None]]:
-        args = [str(color), title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = await self._transport.function_call('AHKWinSetTransColor', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (str(color), title, text, exclude_title, exclude_text, *suffix)
+        resp = await self._call('AHKWinSetTransColor', args, blocking=blocking)
         return resp
 
     # alias for backwards compatibility
@@ -2430,11 +1712,10 @@ class AsyncAHK:
         blocking: bool = True,
         coord_mode: Optional[CoordModeRelativeTo] = None,
     ) -> Union[None, AsyncFutureResult[None]]:
-        button = 'R'
         return await self.click(
             x,
             y,
-            button=button,
+            button='R',
             click_count=click_count,
             direction=direction,
             relative=relative,
@@ -2464,23 +1745,20 @@ class AsyncAHK:
         blocking: bool = True,
         coord_mode: Optional[CoordModeRelativeTo] = None,
     ) -> Union[None, AsyncFutureResult[None]]:
-        if x or y:
-            if y is None and isinstance(x, tuple) and len(x) == 2:
-                #  allow position to be specified by a two-sequence tuple
-                x, y = x
-            assert x is not None and y is not None, 'If provided, position must be specified by x AND y'
+        if y is None and isinstance(x, tuple):
+            #  allow position to be specified by a two-sequence tuple
+            x, y = x
+        assert (x is None) == (y is None), 'If provided, position must be specified by x AND y'
         if button is None:
             button = 'L'
         button = resolve_button(button)
-
-        if relative:
-            r = 'Rel'
+        r = 'Rel' if relative else ''
+        if x is None:
+            position = ('', '')
         else:
-            r = ''
-        if coord_mode is None:
-            coord_mode = ''
-        args = [str(x), str(y), button, str(click_count), direction or '', r, coord_mode]
-        resp = await self._transport.function_call('AHKClick', args, blocking=blocking)
+            position = (str(x), str(y))
+        args = (*position, button, str(click_count), direction or '', r, coord_mode or '')
+        resp = await self._call('AHKClick', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -2511,21 +1789,7 @@ class AsyncAHK:
         https://www.autohotkey.com/docs/commands/ImageSearch.htm
         """
 
-        if scale_height and not scale_width:
-            scale_width = -1
-        elif scale_width and not scale_height:
-            scale_height = -1
-
-        options: List[Union[str, int]] = []
-        if icon:
-            options.append(f'Icon{icon}')
-        if color_variation is not None:
-            options.append(color_variation)
-        if transparent is not None:
-            options.append(f'Trans{transparent}')
-        if scale_width:
-            options.append(f'w{scale_width}')
-            options.append(f'h{scale_height}')
+        options = _image_search_options(icon, color_variation, transparent, scale_width, scale_height)
 
         x1, y1 = upper_bound
         if lower_bound:
@@ -2533,16 +1797,8 @@ class AsyncAHK:
         else:
             x2, y2 = ('A_ScreenWidth', 'A_ScreenHeight')
 
-        args = [str(x1), str(y1), str(x2), str(y2)]
-        if options:
-            s = ''
-            for opt in options:
-                s += f'*{opt} '
-            s += image_path
-            args.append(s)
-        else:
-            args.append(image_path)
-        resp = await self._transport.function_call('AHKImageSearch', args, blocking=blocking)
+        args = (str(x1), str(y1), str(x2), str(y2), f'{options}{image_path}')
+        resp = await self._call('AHKImageSearch', args, blocking=blocking)
         return resp
 
     async def mouse_drag(
@@ -2610,39 +1866,17 @@ class AsyncAHK:
         title_match_mode: Optional[TitleMatchMode] = None,
         detect_hidden_windows: Optional[bool] = None,
     ) -> Union[None, AsyncFutureResult[None]]:
-        args: List[str]
-        args = [title, text, str(seconds_to_wait) if seconds_to_wait is not None else '', exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (
+            title,
+            text,
+            str(seconds_to_wait) if seconds_to_wait is not None else '',
+            exclude_title,
+            exclude_text,
+            *suffix,
+        )
 
-        resp = await self._transport.function_call('AHKWinClose', args=args, blocking=blocking)
+        resp = await self._call('AHKWinClose', args=args, blocking=blocking)
         return resp
 
     async def block_forever(self) -> NoReturn:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import asyncio.subprocess
+import asyncio.subprocess  # unasync: remove
 import atexit
 import os
 import subprocess
@@ -8,17 +8,22 @@ import sys
 import warnings
 from abc import ABC
 from abc import abstractmethod
-from io import BytesIO
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from shutil import which
 from typing import Any
 from typing import AnyStr
+from typing import AsyncIterator
 from typing import Generic
+from typing import Iterator
 from typing import List
 from typing import Literal
+from typing import Mapping
 from typing import Optional
 from typing import overload
 from typing import Protocol
 from typing import runtime_checkable
+from typing import Sequence
 from typing import Tuple
 from typing import TYPE_CHECKING
 from typing import TypeVar
@@ -47,8 +52,8 @@ T_SyncFuture = TypeVar('T_SyncFuture')
 
 
 class AsyncFutureResult(Generic[T_AsyncFuture]):  # unasync: remove
-    def __init__(self, task: asyncio.Task[T_AsyncFuture]):
-        self._task: asyncio.Task[T_AsyncFuture] = task
+    def __init__(self, task: asyncio.Future[T_AsyncFuture]):
+        self._task: asyncio.Future[T_AsyncFuture] = task
 
     async def result(self) -> T_AsyncFuture:
         return await self._task
@@ -66,6 +71,12 @@ AsyncIOProcess: TypeAlias = asyncio.subprocess.Process  # unasync: remove
 
 SyncIOProcess: TypeAlias = 'subprocess.Popen[bytes]'
 
+AsyncBatchFuture: TypeAlias = 'asyncio.Future[Any]'  # unasync: remove
+SyncBatchFuture: TypeAlias = 'Future[Any]'
+
+# Windows anonymous pipes buffer about 4KB by default (Linux pipes hold 64KB)
+_BATCH_CHUNK_SIZE = 4096
+
 
 FunctionName = Literal[
     'AHKControlClick',
@@ -176,9 +187,13 @@ class AsyncAHKProcess:
 
     async def start(self) -> None:
         self._proc = await async_create_process(self.runargs)
-        atexit.register(kill, self._proc)
+        atexit.register(self._kill_at_exit)
         return None
 
+    def _kill_at_exit(self) -> None:
+        if self._proc is not None:
+            kill(self._proc)
+
     async def adrain_stdin(self) -> None:  # unasync: remove
         assert self._proc is not None
         assert self._proc.stdin is not None
@@ -203,8 +218,24 @@ class AsyncAHKProcess:
         assert isinstance(line, bytes)
         return line
 
+    async def read_response(self) -> bytes:
+        assert self._proc is not None
+        assert self._proc.stdout is not None
+        # bind the stream's readline once rather than going through self.readline (and its checks) for every line
+        readline = self._proc.stdout.readline
+        tom = await readline()
+        num_lines = await readline()
+        content = bytearray(tom)
+        content += num_lines
+        for _ in range(int(num_lines) + 1):
+            content += await readline()
+        del content[-1:]
+        return bytes(content)
+
     def kill(self) -> None:
         assert self._proc is not None
+        # a process that was explicitly killed no longer needs (nor should stay referenced by) an exit handler
+        atexit.unregister(self._kill_at_exit)
         self._proc.kill()
 
 
@@ -218,6 +249,14 @@ def sync_create_process(runargs: List[str]) -> subprocess.Popen[bytes]:
     return subprocess.Popen(runargs, stdin=subprocess.PIPE, stderr=subprocess.PIPE, stdout=subprocess.PIPE)
 
 
+def async_create_future() -> asyncio.Future[Any]:  # unasync: remove
+    return asyncio.get_running_loop().create_future()
+
+
+def sync_create_future() -> Future[Any]:
+    return Future()
+
+
 class AhkExecutableNotFoundError(EnvironmentError):
     pass
 
@@ -262,13 +301,56 @@ def _resolve_executable_path(executable_path: Union[str, os.PathLike[AnyStr]] =
     return executable_path
 
 
+def _chunk_batch(
+    batch: List[Tuple[RequestMessage, Optional[AsyncAHK], AsyncBatchFuture]]
+) -> Iterator[Tuple[bytes, List[Tuple[Optional[AsyncAHK], AsyncBatchFuture]]]]:
+    """
+    Split queued requests into chunks that fit in the daemon's stdin pipe; a larger request is a chunk of its own
+
+    Writing more than that before reading the responses can deadlock: once its stdout pipe is full of unread
+    responses, the daemon stops reading stdin and the write blocks forever.
+    """
+    messages: List[bytes] = []
+    items: List[Tuple[Optional[AsyncAHK], AsyncBatchFuture]] = []
+    size = 0
+    for request, engine, fut in batch:
+        msg = request.format()
+        if messages and size + len(msg) > _BATCH_CHUNK_SIZE:
+            yield b''.join(messages), items
+            messages, items, size = [], [], 0
+        messages.append(msg)
+        items.append((engine, fut))
+        size += len(msg)
+    if messages:
+        yield b''.join(messages), items
+
+
+class _PendingBatch:
+    """
+    Requests queued by an open batch() block
+
+    Tasks (or contexts) created inside the block keep a reference after it exits, so the batch is marked closed
+    to make their later calls send normally rather than queue requests that are never flushed.
+    """
+
+    __slots__ = ('requests', 'closed')
+
+    def __init__(self) -> None:
+        self.requests: List[Tuple[RequestMessage, Optional[AsyncAHK], AsyncBatchFuture]] = []
+        self.closed = False
+
+
+# open batches are per-context (per task, or per thread in the sync API), so calls made concurrently from outside
+# a batch block are never swept into it. The mapping is never mutated; opening a batch sets a new one.
+_pending_batches: ContextVar[Mapping[AsyncTransport, _PendingBatch]] = ContextVar('ahk_pending_batches', default={})
+
+
 class AsyncTransport(ABC):
     _started: bool = False
 
     def __init__(self, /, executable_path: Union[str, os.PathLike[AnyStr]] = '', **kwargs: Any):
         self._executable_path: str = _resolve_executable_path(executable_path=executable_path)
         self._hotkey_transport = ThreadedHotkeyTransport(executable_path=self._executable_path)
-        pass
 
     def add_hotkey(self, hotkey: Hotkey) -> None:
         with warnings.catch_warnings(record=True) as caught_warnings:
@@ -298,161 +380,161 @@ class AsyncTransport(ABC):
 
     # fmt: off
     @overload
-    async def function_call(self, function_name: Literal['AHKWinExist'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[bool, AsyncFutureResult[bool]]: ...
+    async def function_call(self, function_name: Literal['AHKWinExist'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[bool, AsyncFutureResult[bool]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKImageSearch'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[Tuple[int, int], None, AsyncFutureResult[Union[Tuple[int, int], None]]]: ...
+    async def function_call(self, function_name: Literal['AHKImageSearch'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[Tuple[int, int], None, AsyncFutureResult[Union[Tuple[int, int], None]]]: ...
     @overload
-    async def function_call(self, function_name: Literal['PixelGetColor'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[str, AsyncFutureResult[str]]: ...
+    async def function_call(self, function_name: Literal['PixelGetColor'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[str, AsyncFutureResult[str]]: ...
     @overload
-    async def function_call(self, function_name: Literal['PixelSearch'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[Tuple[int, int], AsyncFutureResult[Tuple[int, int]]]: ...
+    async def function_call(self, function_name: Literal['PixelSearch'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[Tuple[int, int], AsyncFutureResult[Tuple[int, int]]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKMouseGetPos'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[Tuple[int, int], AsyncFutureResult[Tuple[int, int]]]: ...
+    async def function_call(self, function_name: Literal['AHKMouseGetPos'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[Tuple[int, int], AsyncFutureResult[Tuple[int, int]]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKKeyState'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[bool, AsyncFutureResult[bool]]: ...
+    async def function_call(self, function_name: Literal['AHKKeyState'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[bool, AsyncFutureResult[bool]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKMouseMove'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
+    async def function_call(self, function_name: Literal['AHKMouseMove'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
     @overload
-    async def function_call(self, function_name: Literal['CoordMode'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
+    async def function_call(self, function_name: Literal['CoordMode'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKClick'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
+    async def function_call(self, function_name: Literal['AHKClick'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
     @overload
-    async def function_call(self, function_name: Literal['MouseClickDrag'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
+    async def function_call(self, function_name: Literal['MouseClickDrag'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKKeyWait'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[int, AsyncFutureResult[int]]: ...
+    async def function_call(self, function_name: Literal['AHKKeyWait'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[int, AsyncFutureResult[int]]: ...
     @overload
-    async def function_call(self, function_name: Literal['SetKeyDelay'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
+    async def function_call(self, function_name: Literal['SetKeyDelay'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKSend'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
+    async def function_call(self, function_name: Literal['AHKSend'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKSendRaw'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
+    async def function_call(self, function_name: Literal['AHKSendRaw'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKSendInput'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
+    async def function_call(self, function_name: Literal['AHKSendInput'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKSendEvent'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
+    async def function_call(self, function_name: Literal['AHKSendEvent'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKSendPlay'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
+    async def function_call(self, function_name: Literal['AHKSendPlay'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
     @overload
-    async def function_call(self, function_name: Literal['SetCapsLockState'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
+    async def function_call(self, function_name: Literal['SetCapsLockState'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKWinGetTitle'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[str, AsyncFutureResult[str]]: ...
+    async def function_call(self, function_name: Literal['AHKWinGetTitle'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[str, AsyncFutureResult[str]]: ...
     @overload
-    async def function_call(self, function_name: Literal['WinGetClass'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[str, AsyncFutureResult[str]]: ...
+    async def function_call(self, function_name: Literal['WinGetClass'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[str, AsyncFutureResult[str]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKWinGetText'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[str, AsyncFutureResult[str]]: ...
+    async def function_call(self, function_name: Literal['AHKWinGetText'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[str, AsyncFutureResult[str]]: ...
     @overload
-    async def function_call(self, function_name: Literal['WinActivate'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
+    async def function_call(self, function_name: Literal['WinActivate'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
     @overload
-    async def function_call(self, function_name: Literal['WinActivateBottom'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
+    async def function_call(self, function_name: Literal['WinActivateBottom'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKWinClose'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
+    async def function_call(self, function_name: Literal['AHKWinClose'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
     @overload
-    async def function_call(self, function_name: Literal['WinHide'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
+    async def function_call(self, function_name: Literal['WinHide'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
     @overload
-    async def function_call(self, function_name: Literal['WinKill'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
+    async def function_call(self, function_name: Literal['WinKill'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
     @overload
-    async def function_call(self, function_name: Literal['WinMaximize'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
+    async def function_call(self, function_name: Literal['WinMaximize'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
     @overload
-    async def function_call(self, function_name: Literal['WinMinimize'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
+    async def function_call(self, function_name: Literal['WinMinimize'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
     @overload
-    async def function_call(self, function_name: Literal['WinRestore'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
+    async def function_call(self, function_name: Literal['WinRestore'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
     @overload
-    async def function_call(self, function_name: Literal['WinShow'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
+    async def function_call(self, function_name: Literal['WinShow'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKWindowList'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[List[AsyncWindow], AsyncFutureResult[List[AsyncWindow]]]: ...
+    async def function_call(self, function_name: Literal['AHKWindowList'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[List[AsyncWindow], AsyncFutureResult[List[AsyncWindow]]]: ...
     @overload
-    async def function_call(self, function_name: Literal['WinSend'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
+    async def function_call(self, function_name: Literal['WinSend'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
     @overload
-    async def function_call(self, function_name: Literal['WinSendRaw'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
+    async def function_call(self, function_name: Literal['WinSendRaw'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKControlSend'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
+    async def function_call(self, function_name: Literal['AHKControlSend'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
     @overload
-    async def function_call(self, function_name: Literal['FromMouse'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[str, AsyncFutureResult[str]]: ...
+    async def function_call(self, function_name: Literal['FromMouse'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[str, AsyncFutureResult[str]]: ...
     @overload
-    async def function_call(self, function_name: Literal['WinGet'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[str, AsyncFutureResult[str]]: ...
+    async def function_call(self, function_name: Literal['WinGet'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[str, AsyncFutureResult[str]]: ...
     @overload
-    async def function_call(self, function_name: Literal['WinSet'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
+    async def function_call(self, function_name: Literal['WinSet'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
     @overload
-    async def function_call(self, function_name: Literal['WinSetTitle'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
+    async def function_call(self, function_name: Literal['WinSetTitle'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKWinIsAlwaysOnTop'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[Optional[bool], AsyncFutureResult[Optional[bool]]]: ...
+    async def function_call(self, function_name: Literal['AHKWinIsAlwaysOnTop'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[Optional[bool], AsyncFutureResult[Optional[bool]]]: ...
     @overload
-    async def function_call(self, function_name: Literal['WinClick'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
+    async def function_call(self, function_name: Literal['WinClick'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKWinMove'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
+    async def function_call(self, function_name: Literal['AHKWinMove'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKWinGetPos'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[Union[Position, None], AsyncFutureResult[Union[None, Position]]]: ...
+    async def function_call(self, function_name: Literal['AHKWinGetPos'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[Union[Position, None], AsyncFutureResult[Union[None, Position]]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKWinGetID'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[Union[None, AsyncWindow], AsyncFutureResult[Union[None, AsyncWindow]]]: ...
+    async def function_call(self, function_name: Literal['AHKWinGetID'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[Union[None, AsyncWindow], AsyncFutureResult[Union[None, AsyncWindow]]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKWinGetIDLast'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[Union[None, AsyncWindow], AsyncFutureResult[Union[None, AsyncWindow]]]: ...
+    async def function_call(self, function_name: Literal['AHKWinGetIDLast'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[Union[None, AsyncWindow], AsyncFutureResult[Union[None, AsyncWindow]]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKWinGetPID'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[Union[int, None], AsyncFutureResult[Union[int, None]]]: ...
+    async def function_call(self, function_name: Literal['AHKWinGetPID'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[Union[int, None], AsyncFutureResult[Union[int, None]]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKWinGetProcessName'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[Union[None, str], AsyncFutureResult[Union[None, str]]]: ...
+    async def function_call(self, function_name: Literal['AHKWinGetProcessName'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[Union[None, str], AsyncFutureResult[Union[None, str]]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKWinGetProcessPath'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[Union[None, str], AsyncFutureResult[Union[None, str]]]: ...
+    async def function_call(self, function_name: Literal['AHKWinGetProcessPath'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[Union[None, str], AsyncFutureResult[Union[None, str]]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKWinGetCount'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[int, AsyncFutureResult[int]]: ...
+    async def function_call(self, function_name: Literal['AHKWinGetCount'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[int, AsyncFutureResult[int]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKWinGetList'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[List[AsyncWindow], AsyncFutureResult[List[AsyncWindow]]]: ...
+    async def function_call(self, function_name: Literal['AHKWinGetList'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[List[AsyncWindow], AsyncFutureResult[List[AsyncWindow]]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKWinGetMinMax'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[Union[None, int], AsyncFutureResult[Union[None, int]]]: ...
+    async def function_call(self, function_name: Literal['AHKWinGetMinMax'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[Union[None, int], AsyncFutureResult[Union[None, int]]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKWinGetControlList'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[List[AsyncControl], None, AsyncFutureResult[Union[List[AsyncControl], None]]]: ...
+    async def function_call(self, function_name: Literal['AHKWinGetControlList'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[List[AsyncControl], None, AsyncFutureResult[Union[List[AsyncControl], None]]]: ...
     # @overload
-    # async def function_call(self, function_name: Literal['AHKWinGetControlListHwnd'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[List[AsyncControl], AsyncFutureResult[List[AsyncControl]]]: ...
+    # async def function_call(self, function_name: Literal['AHKWinGetControlListHwnd'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[List[AsyncControl], AsyncFutureResult[List[AsyncControl]]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKWinGetTransparent'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[Union[None, int], AsyncFutureResult[Union[None, int]]]: ...
+    async def function_call(self, function_name: Literal['AHKWinGetTransparent'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[Union[None, int], AsyncFutureResult[Union[None, int]]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKWinGetTransColor'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[Union[None, str], AsyncFutureResult[Union[None, str]]]: ...
+    async def function_call(self, function_name: Literal['AHKWinGetTransColor'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[Union[None, str], AsyncFutureResult[Union[None, str]]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKWinGetStyle'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[Union[None, str], AsyncFutureResult[Union[None, str]]]: ...
+    async def function_call(self, function_name: Literal['AHKWinGetStyle'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[Union[None, str], AsyncFutureResult[Union[None, str]]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKWinGetExStyle'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[Union[None, str], AsyncFutureResult[Union[None, str]]]: ...
+    async def function_call(self, function_name: Literal['AHKWinGetExStyle'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[Union[None, str], AsyncFutureResult[Union[None, str]]]: ...
 
     @overload
-    async def function_call(self, function_name: Literal['AHKWinSetAlwaysOnTop'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
+    async def function_call(self, function_name: Literal['AHKWinSetAlwaysOnTop'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKWinSetBottom'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
+    async def function_call(self, function_name: Literal['AHKWinSetBottom'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKWinSetTop'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
+    async def function_call(self, function_name: Literal['AHKWinSetTop'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKWinSetDisable'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
+    async def function_call(self, function_name: Literal['AHKWinSetDisable'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKWinSetEnable'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
+    async def function_call(self, function_name: Literal['AHKWinSetEnable'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKWinSetRedraw'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
+    async def function_call(self, function_name: Literal['AHKWinSetRedraw'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKWinSetStyle'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[bool, AsyncFutureResult[bool]]: ...
+    async def function_call(self, function_name: Literal['AHKWinSetStyle'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[bool, AsyncFutureResult[bool]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKWinSetExStyle'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[bool, AsyncFutureResult[bool]]: ...
+    async def function_call(self, function_name: Literal['AHKWinSetExStyle'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[bool, AsyncFutureResult[bool]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKWinSetRegion'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[bool, AsyncFutureResult[bool]]: ...
+    async def function_call(self, function_name: Literal['AHKWinSetRegion'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[bool, AsyncFutureResult[bool]]: ...
 
     @overload
-    async def function_call(self, function_name: Literal['AHKWinSetTransparent'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
+    async def function_call(self, function_name: Literal['AHKWinSetTransparent'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKWinSetTransColor'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
+    async def function_call(self, function_name: Literal['AHKWinSetTransColor'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[None, AsyncFutureResult[None]]: ...
 
     @overload
-    async def function_call(self, function_name: Literal['AHKSetDetectHiddenWindows'], args: Optional[List[str]] = None) -> None: ...
+    async def function_call(self, function_name: Literal['AHKSetDetectHiddenWindows'], args: Optional[Sequence[str]] = None) -> None: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKWinSetTitle'], args: Optional[List[str]] = None, *, blocking: bool = True) -> Union[None, AsyncFutureResult[None]]: ...
+    async def function_call(self, function_name: Literal['AHKWinSetTitle'], args: Optional[Sequence[str]] = None, *, blocking: bool = True) -> Union[None, AsyncFutureResult[None]]: ...
     @overload
-    async def function_call(self, function_name: Literal['AHKSetTitleMatchMode'], args: Optional[List[str]] = None) -> None: ...
+    async def function_call(self, function_name: Literal['AHKSetTitleMatchMode'], args: Optional[Sequence[str]] = None) -> None: ...
     @overload
     async def function_call(self, function_name: Literal['AHKGetTitleMatchMode']) -> str: ...
     @overload
     async def function_call(self, function_name: Literal['AHKGetTitleMatchSpeed']) -> str: ...
 
     @overload
-    async def function_call(self, function_name: Literal['AHKControlGetText'], args: Optional[List[str]] = None, *, engine: Optional[AsyncAHK] = None, blocking: bool = True) -> Union[str, AsyncFutureResult[str]]: ...
+    async def function_call(self, function_name: Literal['AHKControlGetText'], args: Optional[Sequence[str]] = None, *, engine: Optional[AsyncAHK] = None, blocking: bool = True) -> Union[str, AsyncFutureResult[str]]: ...
 
     @overload
-    async def function_call(self, function_name: Literal['AHKControlClick'], args: Optional[List[str]] = None, *, blocking: bool = True) -> Union[None, AsyncFutureResult[None]]: ...
+    async def function_call(self, function_name: Literal['AHKControlClick'], args: Optional[Sequence[str]] = None, *, blocking: bool = True) -> Union[None, AsyncFutureResult[None]]: ...
 
     @overload
-    async def function_call(self, function_name: Literal['AHKControlGetPos'], args: Optional[List[str]] = None, *, blocking: bool = True) -> Union[Position, AsyncFutureResult[Position]]: ...
+    async def function_call(self, function_name: Literal['AHKControlGetPos'], args: Optional[Sequence[str]] = None, *, blocking: bool = True) -> Union[Position, AsyncFutureResult[Position]]: ...
 
     @overload
     async def function_call(self, function_name: Literal['AHKGetCoordMode'], args: List[str]) -> str: ...
@@ -461,43 +543,111 @@ class AsyncTransport(ABC):
     async def function_call(self, function_name: Literal['AHKSetCoordMode'], args: List[str]) -> None: ...
 
     # @overload
-    # async def function_call(self, function_name: Literal['HideTrayTip'], args: Optional[List[str]] = None) -> None: ...
+    # async def function_call(self, function_name: Literal['HideTrayTip'], args: Optional[Sequence[str]] = None) -> None: ...
     # @overload
-    # async def function_call(self, function_name: Literal['BaseCheck'], args: Optional[List[str]] = None) -> None: ...
+    # async def function_call(self, function_name: Literal['BaseCheck'], args: Optional[Sequence[str]] = None) -> None: ...
     # @overload
-    # async def function_call(self, function_name: Literal['WinWait'], args: Optional[List[str]] = None) -> str: ...
+    # async def function_call(self, function_name: Literal['WinWait'], args: Optional[Sequence[str]] = None) -> str: ...
     # @overload
-    # async def function_call(self, function_name: Literal['WinWaitActive'], args: Optional[List[str]] = None) -> str: ...
+    # async def function_call(self, function_name: Literal['WinWaitActive'], args: Optional[Sequence[str]] = None) -> str: ...
     # @overload
-    # async def function_call(self, function_name: Literal['WinWaitNotActive'], args: Optional[List[str]] = None) -> str: ...
+    # async def function_call(self, function_name: Literal['WinWaitNotActive'], args: Optional[Sequence[str]] = None) -> str: ...
     # @overload
-    # async def function_call(self, function_name: Literal['WinWaitClose'], args: Optional[List[str]] = None) -> None: ...
+    # async def function_call(self, function_name: Literal['WinWaitClose'], args: Optional[Sequence[str]] = None) -> None: ...
     # @overload
-    # async def function_call(self, function_name: Literal['RegRead'], args: Optional[List[str]] = None) -> None: ...
+    # async def function_call(self, function_name: Literal['RegRead'], args: Optional[Sequence[str]] = None) -> None: ...
     # @overload
-    # async def function_call(self, function_name: Literal['SetRegView'], args: Optional[List[str]] = None) -> None: ...
+    # async def function_call(self, function_name: Literal['SetRegView'], args: Optional[Sequence[str]] = None) -> None: ...
     # @overload
-    # async def function_call(self, function_name: Literal['RegWrite'], args: Optional[List[str]] = None) -> None: ...
+    # async def function_call(self, function_name: Literal['RegWrite'], args: Optional[Sequence[str]] = None) -> None: ...
     # @overload
-    # async def function_call(self, function_name: Literal['RegDelete'], args: Optional[List[str]] = None) -> None: ...
+    # async def function_call(self, function_name: Literal['RegDelete'], args: Optional[Sequence[str]] = None) -> None: ...
 
     # fmt: on
 
     async def function_call(
         self,
         function_name: FunctionName,
-        args: Optional[List[str]] = None,
+        args: Optional[Sequence[str]] = None,
         blocking: bool = True,
         engine: Optional[AsyncAHK] = None,
     ) -> Any:
         if not self._started:
             await self.init()
         request = RequestMessage(function_name=function_name, args=args)
+        pending = self._current_batch()
         if blocking:
+            if pending is not None and pending.requests:
+                await self.flush()
             return await self.send(request, engine=engine)
+        elif pending is not None:
+            return self._queue_request(pending, request, engine=engine)
         else:
             return await self.a_send_nonblocking(request, engine=engine)
 
+    def _current_batch(self) -> Optional[_PendingBatch]:
+        pending = _pending_batches.get().get(self)
+        if pending is None or pending.closed:
+            return None
+        return pending
+
+    def _queue_request(
+        self,
+        pending: _PendingBatch,
+        request: RequestMessage,
+        engine: Optional[AsyncAHK] = None,
+    ) -> AsyncFutureResult[
+        Union[None, Tuple[int, int], int, str, bool, AsyncWindow, List[AsyncWindow], List[AsyncControl]]
+    ]:
+        fut = async_create_future()
+        pending.requests.append((request, engine, fut))
+        return AsyncFutureResult(fut)
+
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[None]:
+        """
+        Queue non-blocking calls made within the block and send them together when the block exits.
+
+        Only calls made from the same task (or thread, in the sync API) are queued. Nested batches are merged
+        into the outermost one. If the block raises, queued calls are not sent and their futures are cancelled.
+        """
+        if self._current_batch() is not None:
+            yield
+            return
+        pending = _PendingBatch()
+        token = _pending_batches.set({**_pending_batches.get(), self: pending})
+        try:
+            yield
+            # tasks created in the block may queue more calls while earlier ones are being sent
+            while pending.requests:
+                await self.flush()
+        finally:
+            pending.closed = True
+            _pending_batches.reset(token)
+            for _, _, fut in pending.requests:
+                fut.cancel()
+
+    async def flush(self) -> None:
+        """
+        Send any calls queued by the current batch and resolve their futures.
+        """
+        pending = self._current_batch()
+        if pending is None or not pending.requests:
+            return None
+        batch, pending.requests = pending.requests, []
+        await self._send_batch(batch)
+        return None
+
+    async def _send_batch(self, batch: List[Tuple[RequestMessage, Optional[AsyncAHK], AsyncBatchFuture]]) -> None:
+        for request, engine, fut in batch:
+            try:
+                result = await self.send(request, engine=engine)
+            except Exception as e:
+                fut.set_exception(e)
+            else:
+                fut.set_result(result)
+        return None
+
     @abstractmethod
     async def send(
         self, request: RequestMessage, engine: Optional[AsyncAHK] = None
@@ -552,15 +702,7 @@ class AsyncDaemonProcessTransport(AsyncTransport):
         try:
             proc.write(msg)
             await proc.adrain_stdin()
-            tom = await proc.readline()
-            num_lines = await proc.readline()
-            content_buffer = BytesIO()
-            content_buffer.write(tom)
-            content_buffer.write(num_lines)
-            for _ in range(int(num_lines) + 1):
-                part = await proc.readline()
-                content_buffer.write(part)
-            content = content_buffer.getvalue()[:-1]
+            content = await proc.read_response()
         except Exception:
             raise
         finally:
@@ -599,18 +741,32 @@ class AsyncDaemonProcessTransport(AsyncTransport):
         assert self._proc is not None
         self._proc.write(msg)
         await self._proc.adrain_stdin()
-        tom = await self._proc.readline()
-        num_lines = await self._proc.readline()
-        content_buffer = BytesIO()
-        content_buffer.write(tom)
-        content_buffer.write(num_lines)
-        for _ in range(int(num_lines) + 1):
-            part = await self._proc.readline()
-            content_buffer.write(part)
-        content = content_buffer.getvalue()[:-1]
+        content = await self._proc.read_response()
         response = ResponseMessage.from_bytes(content, engine=engine)
         return response.unpack()  # type: ignore
 
+    async def _send_batch(self, batch: List[Tuple[RequestMessage, Optional[AsyncAHK], AsyncBatchFuture]]) -> None:
+        # the daemon handles requests in order, so each chunk is written in one go before reading its responses
+        assert self._proc is not None
+        try:
+            for chunk, items in _chunk_batch(batch):
+                self._proc.write(chunk)
+                await self._proc.adrain_stdin()
+                for engine, fut in items:
+                    content = await self._proc.read_response()
+                    # a bad response only fails its own call; the rest must still be read off the daemon's stdout
+                    try:
+                        response = ResponseMessage.from_bytes(content, engine=engine)
+                        fut.set_result(response.unpack())
+                    except Exception as e:
+                        fut.set_exception(e)
+        except BaseException as e:
+            for _, _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(e)
+            raise
+        return None
+
 
 if TYPE_CHECKING:
     from .engine import AsyncAHK
@@ -47,11 +47,14 @@ _SETTERS_REMOVED_ERROR_MESSAGE = (
 
 
 class AsyncWindow:
+    __slots__ = ('_engine', '_ahk_id', '_win_title')
+
     def __init__(self, engine: AsyncAHK, ahk_id: str):
         self._engine: AsyncAHK = engine
         if not ahk_id:
             raise ValueError(f'Invalid ahk_id: {ahk_id!r}')
         self._ahk_id: str = ahk_id
+        self._win_title: str = f'ahk_id {ahk_id}'
 
     def __repr__(self) -> str:
         return f'<{self.__class__.__qualname__} ahk_id={self._ahk_id}>'
@@ -64,15 +67,24 @@ class AsyncWindow:
     def __hash__(self) -> int:
         return hash(self._ahk_id)
 
-    async def close(self) -> None:
-        await self._engine.win_close(
-            title=f'ahk_id {self._ahk_id}', detect_hidden_windows=True, title_match_mode=(1, 'Fast')
+    # fmt: off
+    @overload
+    async def close(self) -> None: ...
+    @overload
+    async def close(self, *, blocking: Literal[False]) -> AsyncFutureResult[None]: ...
+    @overload
+    async def close(self, *, blocking: Literal[True]) -> None: ...
+    @overload
+    async def close(self, *, blocking: bool = True) -> Union[None, AsyncFutureResult[None]]: ...
+    # fmt: on
+    async def close(self, *, blocking: bool = True) -> Union[None, AsyncFutureResult[None]]:
+        return await self._engine.win_close(
+            title=self._win_title, blocking=blocking, detect_hidden_windows=True, title_match_mode=(1, 'Fast')
         )
-        return None
 
     async def exists(self) -> bool:
         return await self._engine.win_exists(
-            title=f'ahk_id {self._ahk_id}', detect_hidden_windows=True, title_match_mode=(1, 'Fast')
+            title=self._win_title, detect_hidden_windows=True, title_match_mode=(1, 'Fast')
         )
 
     @property
@@ -88,7 +100,7 @@ class AsyncWindow:
 
     async def get_pid(self) -> int:
         pid = await self._engine.win_get_pid(
-            title=f'ahk_id {self._ahk_id}', detect_hidden_windows=True, title_match_mode=(1, 'Fast')
+            title=self._win_title, detect_hidden_windows=True, title_match_mode=(1, 'Fast')
         )
         if pid is None:
             raise WindowNotFoundException(
@@ -105,7 +117,7 @@ class AsyncWindow:
 
     async def get_process_name(self) -> str:
         name = await self._engine.win_get_process_name(
-            title=f'ahk_id {self._ahk_id}', detect_hidden_windows=True, title_match_mode=(1, 'Fast')
+            title=self._win_title, detect_hidden_windows=True, title_match_mode=(1, 'Fast')
         )
         if name is None:
             raise WindowNotFoundException(
@@ -122,7 +134,7 @@ class AsyncWindow:
 
     async def get_process_path(self) -> str:
         path = await self._engine.win_get_process_path(
-            title=f'ahk_id {self._ahk_id}', detect_hidden_windows=True, title_match_mode=(1, 'Fast')
+            title=self._win_title, detect_hidden_windows=True, title_match_mode=(1, 'Fast')
         )
         if path is None:
             raise WindowNotFoundException(
@@ -139,7 +151,7 @@ class AsyncWindow:
 
     async def get_minmax(self) -> int:
         minmax = await self._engine.win_get_minmax(
-            title=f'ahk_id {self._ahk_id}', detect_hidden_windows=True, title_match_mode=(1, 'Fast')
+            title=self._win_title, detect_hidden_windows=True, title_match_mode=(1, 'Fast')
         )
         if minmax is None:
             raise WindowNotFoundException(
@@ -149,7 +161,7 @@ class AsyncWindow:
 
     async def get_title(self) -> str:
         title = await self._engine.win_get_title(
-            title=f'ahk_id {self._ahk_id}', detect_hidden_windows=True, title_match_mode=(1, 'Fast')
+            title=self._win_title, detect_hidden_windows=True, title_match_mode=(1, 'Fast')
         )
         return title
 
@@ -165,18 +177,28 @@ class AsyncWindow:
         raise RuntimeError(_SETTERS_REMOVED_ERROR_MESSAGE)  # unasync: remove
         self.set_title(value)
 
-    async def set_title(self, new_title: str) -> None:
-        await self._engine.win_set_title(
-            title=f'ahk_id {self._ahk_id}',
+    # fmt: off
+    @overload
+    async def set_title(self, new_title: str) -> None: ...
+    @overload
+    async def set_title(self, new_title: str, *, blocking: Literal[False]) -> AsyncFutureResult[None]: ...
+    @overload
+    async def set_title(self, new_title: str, *, blocking: Literal[True]) -> None: ...
+    @overload
+    async def set_title(self, new_title: str, *, blocking: bool = True) -> Union[None, AsyncFutureResult[None]]: ...
+    # fmt: on
+    async def set_title(self, new_title: str, *, blocking: bool = True) -> Union[None, AsyncFutureResult[None]]:
+        return await self._engine.win_set_title(
+            title=self._win_title,
+            blocking=blocking,
             detect_hidden_windows=True,
             new_title=new_title,
             title_match_mode=(1, 'Fast'),
         )
-        return None
 
     async def list_controls(self) -> Sequence['AsyncControl']:
         controls = await self._engine.win_get_control_list(
-            title=f'ahk_id {self._ahk_id}', detect_hidden_windows=True, title_match_mode=(1, 'Fast')
+            title=self._win_title, detect_hidden_windows=True, title_match_mode=(1, 'Fast')
         )
         if controls is None:
             raise WindowNotFoundException(
@@ -199,7 +221,7 @@ class AsyncWindow:
     ) -> Union[None, AsyncFutureResult[None]]:
         return await self._engine.win_set_always_on_top(
             toggle=toggle,
-            title=f'ahk_id {self._ahk_id}',
+            title=self._win_title,
             blocking=blocking,
             detect_hidden_windows=True,
             title_match_mode=(1, 'Fast'),
@@ -216,10 +238,9 @@ class AsyncWindow:
     async def is_always_on_top(self, *, blocking: bool = True) -> Union[bool, AsyncFutureResult[Optional[bool]]]: ...
     # fmt: on
     async def is_always_on_top(self, *, blocking: bool = True) -> Union[bool, AsyncFutureResult[Optional[bool]]]:
-        args = [f'ahk_id {self._ahk_id}']
-        resp = await self._engine._transport.function_call(
-            'AHKWinIsAlwaysOnTop', args, blocking=blocking
-        )  # XXX: maybe shouldn't access transport directly?
+        args = (self._win_title,)
+        # uses the engine's private _call shortcut; there is no public engine method for this query
+        resp = await self._engine._call('AHKWinIsAlwaysOnTop', args, blocking=blocking)
         if resp is None:
             raise WindowNotFoundException(
                 f'Error when trying to get always on top style for window {self._ahk_id}. The window may have been closed before the operation could be completed'
@@ -248,7 +269,7 @@ class AsyncWindow:
     async def send(self, keys: str, *, blocking: bool = True) -> Union[None, AsyncFutureResult[None]]:
         return await self._engine.control_send(
             keys=keys,
-            title=f'ahk_id {self._ahk_id}',
+            title=self._win_title,
             blocking=blocking,
             detect_hidden_windows=True,
             title_match_mode=(1, 'Fast'),
@@ -266,7 +287,7 @@ class AsyncWindow:
     # fmt: on
     async def get_text(self, *, blocking: bool = True) -> Union[str, AsyncFutureResult[str]]:
         return await self._engine.win_get_text(
-            title=f'ahk_id {self._ahk_id}', blocking=blocking, detect_hidden_windows=True, title_match_mode=(1, 'Fast')
+            title=self._win_title, blocking=blocking, detect_hidden_windows=True, title_match_mode=(1, 'Fast')
         )
 
     @property
@@ -285,7 +306,7 @@ class AsyncWindow:
     # fmt: on
     async def get_position(self, blocking: bool = True) -> Union[Position, AsyncFutureResult[Optional[Position]]]:
         resp = await self._engine.win_get_position(
-            title=f'ahk_id {self._ahk_id}',
+            title=self._win_title,
             blocking=blocking,
             detect_hidden_windows=True,
             title_match_mode=(1, 'Fast'),
@@ -298,6 +319,8 @@ class AsyncWindow:
 
 
 class AsyncControl:
+    __slots__ = ('window', 'hwnd', 'control_class', '_engine')
+
     def __init__(self, window: AsyncWindow, hwnd: str, control_class: str):
         self.window: AsyncWindow = window
         self.hwnd: str = hwnd
@@ -327,7 +350,7 @@ class AsyncControl:
             control=self.control_class,
             click_count=click_count,
             options=options,
-            title=f'ahk_id {self.window._ahk_id}',
+            title=self.window._win_title,
             title_match_mode=(1, 'Fast'),
             detect_hidden_windows=True,
             blocking=blocking,
@@ -347,7 +370,7 @@ class AsyncControl:
         return await self._engine.control_send(
             keys=keys,
             control=self.control_class,
-            title=f'ahk_id {self.window._ahk_id}',
+            title=self.window._win_title,
             blocking=blocking,
             detect_hidden_windows=True,
             title_match_mode=(1, 'Fast'),
@@ -356,7 +379,7 @@ class AsyncControl:
     async def get_text(self, blocking: bool = True) -> Union[str, AsyncFutureResult[str]]:
         return await self._engine.control_get_text(
             control=self.control_class,
-            title=f'ahk_id {self.window._ahk_id}',
+            title=self.window._win_title,
             blocking=blocking,
             detect_hidden_windows=True,
             title_match_mode=(1, 'Fast'),
@@ -375,7 +398,7 @@ class AsyncControl:
     async def get_position(self, blocking: bool = True) -> Union[Position, AsyncFutureResult[Position]]:
         return await self._engine.control_get_position(
             control=self.control_class,
-            title=f'ahk_id {self.window._ahk_id}',
+            title=self.window._win_title,
             blocking=blocking,
             detect_hidden_windows=True,
             title_match_mode=(1, 'Fast'),
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
-import asyncio
+import functools
 import sys
 import time
 import warnings
+from contextlib import contextmanager
 from typing import Any
 from typing import Awaitable
 from typing import Callable
 from typing import Coroutine
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Literal
 from typing import NoReturn
@@ -38,10 +40,8 @@ sleep = time.sleep
 
 SyncFilterFunc: TypeAlias = Callable[[Window], bool]
 
-CoordModeTargets: TypeAlias = Union[
-    Literal['ToolTip'], Literal['Pixel'], Literal['Mouse'], Literal['Caret'], Literal['Menu']
-]
-CoordModeRelativeTo: TypeAlias = Union[Literal['Screen', 'Relative', 'Window', 'Client', '']]
+CoordModeTargets: TypeAlias = Literal['ToolTip', 'Pixel', 'Mouse', 'Caret', 'Menu']
+CoordModeRelativeTo: TypeAlias = Literal['Screen', 'Relative', 'Window', 'Client', '']
 
 CoordMode: TypeAlias = Union[CoordModeTargets, Tuple[CoordModeTargets, CoordModeRelativeTo]]
 
@@ -52,6 +52,28 @@ TitleMatchMode: TypeAlias = Optional[
     Union[MatchModes, MatchSpeeds, Tuple[Union[MatchModes, MatchSpeeds], Union[MatchSpeeds, MatchModes]]]
 ]
 
+_DHW_MAP: Dict[Optional[bool], str] = {True: 'On', False: 'Off', None: ''}
+
+# suffix for the default (None, None) window query settings; both defaults are valid, so nothing needs checking
+_EMPTY_SUFFIX: Tuple[str, str, str] = ('', '', '')
+
+_TMM_MAP: Dict[Union[MatchModes, MatchSpeeds], Tuple[str, str]] = {
+    1: ('1', ''),
+    2: ('2', ''),
+    3: ('3', ''),
+    'RegEx': ('RegEx', ''),
+    'Fast': ('', 'Fast'),
+    'Slow': ('', 'Slow'),
+}
+
+# KeyWait options keyed by (released, logical_state)
+_KEY_WAIT_OPTIONS: Dict[Tuple[bool, bool], str] = {
+    (False, False): 'D',
+    (False, True): 'DL',
+    (True, False): '',
+    (True, True): 'L',
+}
+
 _BUTTONS: dict[Union[str, int], str] = {
     1: 'L',
     2: 'R',
@@ -92,6 +114,96 @@ SyncPropertyReturnOptionalAsyncWindow: TypeAlias = Optional[Window]
 _PROPERTY_DEPRECATION_WARNING_MESSAGE = 'Use of the {0} property is not recommended (in the async API only) and may be removed in a future version. Use the get_{0} method instead'
 
 
+def _resolve_title_match_mode(title_match_mode: TitleMatchMode) -> Tuple[str, str]:
+    """
+    Resolve a title match mode argument to the (match mode, match speed) strings passed to AHK
+    """
+    if isinstance(title_match_mode, tuple):
+        match_mode, match_speed = title_match_mode
+        return str(match_mode), str(match_speed)
+    try:
+        return _TMM_MAP[title_match_mode]  # type: ignore[index]
+    except (KeyError, TypeError):
+        raise ValueError(
+            f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
+        ) from None
+
+
+def _build_window_query_suffix(
+    detect_hidden_windows: Optional[bool], title_match_mode: Optional[TitleMatchMode]
+) -> Tuple[str, str, str]:
+    if title_match_mode is not None:
+        match_mode, match_speed = _resolve_title_match_mode(title_match_mode)
+    else:
+        match_mode = match_speed = ''
+    return _DHW_MAP[detect_hidden_windows], match_mode, match_speed
+
+
+# typed, so that equal values of different types (1 and True) do not share an entry
+_cached_window_query_suffix = functools.lru_cache(maxsize=64, typed=True)(_build_window_query_suffix)
+
+
+def _window_query_suffix(
+    detect_hidden_windows: Optional[bool], title_match_mode: Optional[TitleMatchMode]
+) -> Tuple[str, str, str]:
+    """
+    Build the detect_hidden_windows, match mode and match speed arguments expected by AHK window functions
+
+    Arguments are checked before the cache is consulted, so invalid values always raise. Tuples are not cached:
+    the cache only tells apart the types of the arguments themselves, not of a tuple's items.
+    """
+    if detect_hidden_windows is None and title_match_mode is None:
+        return _EMPTY_SUFFIX
+    if detect_hidden_windows is not None and not isinstance(detect_hidden_windows, bool):
+        raise TypeError(
+            f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
+        )
+    if title_match_mode is None or isinstance(title_match_mode, (int, str)):
+        return _cached_window_query_suffix(detect_hidden_windows, title_match_mode)
+    return _build_window_query_suffix(detect_hidden_windows, title_match_mode)
+
+
+@functools.lru_cache(maxsize=256)
+def _key_from_name(key_name: str) -> Key:
+    """
+    Return a shared Key for a key name. Keys are never mutated, so the same instance can be reused across calls
+    """
+    return Key(key_name=key_name)
+
+
+@functools.lru_cache(maxsize=128, typed=True)
+def _image_search_options(
+    icon: Optional[int],
+    color_variation: Optional[int],
+    transparent: Optional[str],
+    scale_width: Optional[int],
+    scale_height: Optional[int],
+) -> str:
+    """
+    Build the '*option ' prefix that ImageSearch expects before the image path
+
+    Searches are often repeated in a polling loop with the same options, so results are cached (typed, since
+    equal values such as 2 and 2.0 or 1 and True format differently).
+    """
+    if scale_height and not scale_width:
+        scale_width = -1
+    elif scale_width and not scale_height:
+        scale_height = -1
+
+    options: List[Union[str, int]] = []
+    if icon:
+        options.append(f'Icon{icon}')
+    if color_variation is not None:
+        options.append(color_variation)
+    if transparent is not None:
+        options.append(f'Trans{transparent}')
+    if scale_width:
+        options.append(f'w{scale_width}')
+        options.append(f'h{scale_height}')
+    return ''.join([f'*{opt} ' for opt in options])
+
+
+@functools.lru_cache(maxsize=128)
 def resolve_button(button: Union[str, int]) -> str:
     """
     Resolve a string of a button name to a canonical name used for AHK script
@@ -127,6 +239,7 @@ class AHK:
         assert TransportClass is not None
         transport = TransportClass(**transport_options)
         self._transport: Transport = transport
+        self._call = transport.function_call
 
     def __getattr__(self, item: Any) -> Any:
         deprecation_replacements: Dict[str, Any] = {'type': self.send_input}
@@ -178,6 +291,28 @@ class AHK:
                 warnings.warn(warning.message, warning.category, stacklevel=2)
         return None
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Send calls made with `blocking=False` inside the block to the AHK process together when the block exits.
+
+        Instead of starting a separate AHK process for each non-blocking call, queued calls are written to the
+        AHK process in one go and their responses read back in order. The returned futures resolve once the
+        block exits (or when a blocking call inside the block sends the calls queued before it).
+
+        Unlike normal non-blocking calls, batched calls run in the same AHK process as blocking calls, so they
+        are affected by settings like `set_title_match_mode`.
+
+        Example::
+
+            with ahk.batch():
+                pid = ahk.win_get_pid(title='Untitled - Notepad', blocking=False)
+                name = ahk.win_get_process_name(title='Untitled - Notepad', blocking=False)
+            print(pid.result(), name.result())
+        """
+        with self._transport.batch():
+            yield
+
     def set_title_match_mode(self, title_match_mode: TitleMatchMode, /) -> None:
         """
         Sets the default title match mode
@@ -192,22 +327,8 @@ class AHK:
         :return: None
         """
 
-        args = []
-        if isinstance(title_match_mode, tuple):
-            (match_mode, match_speed) = title_match_mode
-        elif title_match_mode in (1, 2, 3, 'RegEx'):
-            match_mode = title_match_mode
-            match_speed = ''
-        elif title_match_mode in ('Fast', 'Slow'):
-            match_mode = ''
-            match_speed = title_match_mode
-        else:
-            raise ValueError(
-                f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-            )
-        args.append(str(match_mode))
-        args.append(str(match_speed))
-        self._transport.function_call('AHKSetTitleMatchMode', args)
+        args = list(_resolve_title_match_mode(title_match_mode))
+        self._call('AHKSetTitleMatchMode', args)
         return None
 
     def get_title_match_mode(self) -> str:
@@ -217,7 +338,7 @@ class AHK:
         I.E. the current value of `A_TitleMatchMode`
 
         """
-        resp = self._transport.function_call('AHKGetTitleMatchMode')
+        resp = self._call('AHKGetTitleMatchMode')
         return resp
 
     def get_title_match_speed(self) -> str:
@@ -227,17 +348,17 @@ class AHK:
         I.E. the current value of `A_TitleMatchModeSpeed`
 
         """
-        resp = self._transport.function_call('AHKGetTitleMatchSpeed')
+        resp = self._call('AHKGetTitleMatchSpeed')
         return resp
 
     def set_coord_mode(self, target: CoordModeTargets, relative_to: CoordModeRelativeTo = 'Screen') -> None:
         args = [str(target), str(relative_to)]
-        self._transport.function_call('AHKSetCoordMode', args)
+        self._call('AHKSetCoordMode', args)
         return None
 
     def get_coord_mode(self, target: CoordModeTargets) -> str:
         args = [str(target)]
-        resp = self._transport.function_call('AHKGetCoordMode', args)
+        resp = self._call('AHKGetCoordMode', args)
         return resp
 
     # fmt: off
@@ -265,37 +386,9 @@ class AHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[None, FutureResult[None]]:
-        args = [control, title, text, str(button), str(click_count), options, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = self._transport.function_call('AHKControlClick', args=args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (control, title, text, str(button), str(click_count), options, exclude_title, exclude_text, *suffix)
+        resp = self._call('AHKControlClick', args=args, blocking=blocking)
 
         return resp
 
@@ -321,37 +414,9 @@ class AHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[str, FutureResult[str]]:
-        args = [control, title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = self._transport.function_call('AHKControlGetText', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (control, title, text, exclude_title, exclude_text, *suffix)
+        resp = self._call('AHKControlGetText', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -376,38 +441,10 @@ class AHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[Position, FutureResult[Position]]:
-        args = [control, title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (control, title, text, exclude_title, exclude_text, *suffix)
 
-        resp = self._transport.function_call('AHKControlGetPos', args, blocking=blocking)
+        resp = self._call('AHKControlGetPos', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -449,37 +486,9 @@ class AHK:
         :param blocking:
         :return:
         """
-        args = [control, keys, title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = self._transport.function_call('AHKControlSend', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (control, keys, title, text, exclude_title, exclude_text, *suffix)
+        resp = self._call('AHKControlSend', args, blocking=blocking)
         return resp
 
     def start_hotkeys(self) -> None:
@@ -511,7 +520,7 @@ class AHK:
             args.append('On')
         else:
             args.append('Off')
-        self._transport.function_call('AHKSetDetectHiddenWindows', args=args)
+        self._call('AHKSetDetectHiddenWindows', args=args)
         return None
 
     # fmt: off
@@ -535,37 +544,9 @@ class AHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[List[Window], FutureResult[List[Window]]]:
-        args = [title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = self._transport.function_call('AHKWindowList', args, engine=self, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (title, text, exclude_title, exclude_text, *suffix)
+        resp = self._call('AHKWindowList', args, engine=self, blocking=blocking)
         return resp
 
     # fmt: off
@@ -581,7 +562,7 @@ class AHK:
     def get_mouse_position(
         self, *, blocking: bool = True
     ) -> Union[Tuple[int, int], FutureResult[Tuple[int, int]]]:
-        resp = self._transport.function_call('AHKMouseGetPos', blocking=blocking)
+        resp = self._call('AHKMouseGetPos', blocking=blocking)
         return resp
 
     @property
@@ -607,20 +588,18 @@ class AHK:
         relative: bool = False,
         blocking: bool = True,
     ) -> Union[None, FutureResult[None]]:
-        if relative and (x is None or y is None):
-            x = x or 0
-            y = y or 0
-        elif not relative and (x is None or y is None):
-            posx, posy = self.get_mouse_position()
-            x = x or posx
-            y = y or posy
-
+        if relative:
+            if x is None:
+                x = 0
+            if y is None:
+                y = 0
+        # an omitted absolute coordinate is filled in from the current cursor position by the daemon
         if speed is None:
             speed = 2
-        args = [str(x), str(y), str(speed)]
+        args = ['' if x is None else str(x), '' if y is None else str(y), str(speed)]
         if relative:
             args.append('R')
-        resp = self._transport.function_call('AHKMouseMove', args, blocking=blocking)
+        resp = self._call('AHKMouseMove', args, blocking=blocking)
         return resp
 
     def a_run_script(self, script_text: str, decode: bool = True, blocking: bool = True, **runkwargs: Any) -> str:
@@ -748,8 +727,8 @@ class AHK:
         self, class_name: str, exact: Optional[bool] = None, title_match_mode: Optional[TitleMatchMode] = None
     ) -> Optional[Window]:
         with warnings.catch_warnings(record=True) as caught_warnings:
-            windows = self.find_windows_by_class(
-                class_name=class_name, exact=exact, title_match_mode=title_match_mode
+            windows = self.find_windows(
+                title=f'ahk_class {class_name}', title_match_mode=title_match_mode, exact=exact
             )
         if caught_warnings:
             for warning in caught_warnings:
@@ -791,12 +770,8 @@ class AHK:
     # fmt: on
     def key_down(self, key: Union[str, Key], *, blocking: bool = True) -> Union[None, FutureResult[None]]:
         if isinstance(key, str):
-            key = Key(key_name=key)
-        if blocking:
-            self.send_input(key.DOWN, blocking=True)
-            return None
-        else:
-            return self.send_input(key.DOWN, blocking=False)
+            key = _key_from_name(key)
+        return self._call('AHKSendInput', (key.DOWN,), blocking=blocking)
 
     # fmt: off
     @overload
@@ -811,16 +786,10 @@ class AHK:
     def key_press(
         self, key: Union[str, Key], *, release: bool = True, blocking: bool = True
     ) -> Union[None, FutureResult[None]]:
-        if blocking:
-            self.key_down(key, blocking=True)
-            if release:
-                self.key_up(key, blocking=True)
-            return None
-        else:
-            d = self.key_down(key, blocking=False)
-            if release:
-                return self.key_up(key, blocking=False)
-            return d
+        d = self.key_down(key, blocking=blocking)
+        if release:
+            return self.key_up(key, blocking=blocking)
+        return d
 
     # fmt: off
     @overload
@@ -833,13 +802,9 @@ class AHK:
     def key_release(self, key: Union[str, Key], *, blocking: bool = True) -> Union[None, FutureResult[None]]: ...
     # fmt: on
     def key_release(self, key: Union[str, Key], *, blocking: bool = True) -> Union[None, FutureResult[None]]:
-        if blocking:
-            self.key_up(key=key, blocking=True)
-            return None
-        else:
-            return self.key_up(key=key, blocking=False)
+        return self.key_up(key=key, blocking=blocking)
 
-    def key_state(self, key_name: str, mode: Optional[Union[Literal['P'], Literal['T']]] = None) -> bool:
+    def key_state(self, key_name: str, mode: Optional[Literal['P', 'T']] = None) -> bool:
         raise NotImplementedError()
 
     # fmt: off
@@ -854,12 +819,8 @@ class AHK:
     # fmt: on
     def key_up(self, key: Union[str, Key], blocking: bool = True) -> Union[None, FutureResult[None]]:
         if isinstance(key, str):
-            key = Key(key_name=key)
-        if blocking:
-            self.send_input(key.UP, blocking=True)
-            return None
-        else:
-            return self.send_input(key.UP, blocking=False)
+            key = _key_from_name(key)
+        return self._call('AHKSendInput', (key.UP,), blocking=blocking)
 
     # fmt: off
     @overload
@@ -880,18 +841,12 @@ class AHK:
         released: bool = False,
         blocking: bool = True,
     ) -> Union[int, FutureResult[int]]:
-        options = ''
-        if not released:
-            options += 'D'
-        if logical_state:
-            options += 'L'
+        options = _KEY_WAIT_OPTIONS[bool(released), bool(logical_state)]
         if timeout:
-            options += f'T{timeout}'
-        args = [key_name]
-        if options:
-            args.append(options)
+            options = f'{options}T{timeout}'
+        args = (key_name, options) if options else (key_name,)
 
-        resp = self._transport.function_call('AHKKeyWait', args)
+        resp = self._call('AHKKeyWait', args, blocking=blocking)
         return resp
 
     def run_script(self, script_text: str, decode: bool = True, blocking: bool = True, **runkwargs: Any) -> str:
@@ -927,10 +882,10 @@ class AHK:
             args.append('')
 
         if raw:
-            raw_resp = self._transport.function_call('AHKSendRaw', args=args, blocking=blocking)
+            raw_resp = self._call('AHKSendRaw', args=args, blocking=blocking)
             return raw_resp
         else:
-            resp = self._transport.function_call('AHKSend', args=args, blocking=blocking)
+            resp = self._call('AHKSend', args=args, blocking=blocking)
             return resp
 
     # fmt: off
@@ -968,7 +923,7 @@ class AHK:
     # fmt: on
     def send_input(self, s: str, *, blocking: bool = True) -> Union[None, FutureResult[None]]:
         args = [s]
-        resp = self._transport.function_call('AHKSendInput', args, blocking=blocking)
+        resp = self._call('AHKSendInput', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -999,12 +954,10 @@ class AHK:
         else:
             args.append('')
 
-        resp = self._transport.function_call('AHKSendPlay', args=args, blocking=blocking)
+        resp = self._call('AHKSendPlay', args=args, blocking=blocking)
         return resp
 
-    def set_capslock_state(
-        self, state: Optional[Union[Literal['On'], Literal['Off'], Literal['AlwaysOn'], Literal['AlwaysOff']]] = None
-    ) -> None:
+    def set_capslock_state(self, state: Optional[Literal['On', 'Off', 'AlwaysOn', 'AlwaysOff']] = None) -> None:
         raise NotImplementedError()
 
     def set_volume(self, value: int, device_number: int = 1) -> None:
@@ -1099,37 +1052,9 @@ class AHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[Window, None, FutureResult[Union[None, Window]]]:
-        args = [title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = self._transport.function_call('AHKWinGetID', args, blocking=blocking, engine=self)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (title, text, exclude_title, exclude_text, *suffix)
+        resp = self._call('AHKWinGetID', args, blocking=blocking, engine=self)
         return resp
 
     # fmt: off
@@ -1153,37 +1078,9 @@ class AHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[str, FutureResult[str]]:
-        args = [title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = self._transport.function_call('AHKWinGetText', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (title, text, exclude_title, exclude_text, *suffix)
+        resp = self._call('AHKWinGetText', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -1207,37 +1104,9 @@ class AHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[str, FutureResult[str]]:
-        args = [title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = self._transport.function_call('AHKWinGetTitle', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (title, text, exclude_title, exclude_text, *suffix)
+        resp = self._call('AHKWinGetTitle', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -1261,40 +1130,11 @@ class AHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[Position, None, FutureResult[Union[Position, None]]]:
-        args = [title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = self._transport.function_call('AHKWinGetPos', args, blocking=blocking, engine=self)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (title, text, exclude_title, exclude_text, *suffix)
+        resp = self._call('AHKWinGetPos', args, blocking=blocking, engine=self)
         return resp
 
-
     # fmt: off
     @overload
     def win_get_idlast(self, title: str = '', text: str = '', exclude_title: str = '', exclude_text: str = '', *, title_match_mode: Optional[TitleMatchMode] = None, detect_hidden_windows: Optional[bool] = None) -> Union[Window, None]: ...
@@ -1316,37 +1156,9 @@ class AHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[Window, None, FutureResult[Union[Window, None]]]:
-        args = [title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = self._transport.function_call('AHKWinGetIDLast', args, blocking=blocking, engine=self)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (title, text, exclude_title, exclude_text, *suffix)
+        resp = self._call('AHKWinGetIDLast', args, blocking=blocking, engine=self)
         return resp
 
     # fmt: off
@@ -1370,37 +1182,9 @@ class AHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[int, None, FutureResult[Union[int, None]]]:
-        args = [title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = self._transport.function_call('AHKWinGetPID', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (title, text, exclude_title, exclude_text, *suffix)
+        resp = self._call('AHKWinGetPID', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -1424,37 +1208,9 @@ class AHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[None, str, FutureResult[Optional[str]]]:
-        args = [title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = self._transport.function_call('AHKWinGetProcessName', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (title, text, exclude_title, exclude_text, *suffix)
+        resp = self._call('AHKWinGetProcessName', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -1478,37 +1234,9 @@ class AHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[str, None, Union[None, str, FutureResult[Optional[str]]]]:
-        args = [title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = self._transport.function_call('AHKWinGetProcessPath', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (title, text, exclude_title, exclude_text, *suffix)
+        resp = self._call('AHKWinGetProcessPath', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -1532,37 +1260,9 @@ class AHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[int, FutureResult[int]]:
-        args = [title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = self._transport.function_call('AHKWinGetCount', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (title, text, exclude_title, exclude_text, *suffix)
+        resp = self._call('AHKWinGetCount', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -1586,37 +1286,9 @@ class AHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[None, int, FutureResult[Optional[int]]]:
-        args = [title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = self._transport.function_call('AHKWinGetMinMax', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (title, text, exclude_title, exclude_text, *suffix)
+        resp = self._call('AHKWinGetMinMax', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -1640,37 +1312,9 @@ class AHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[List[Control], None, FutureResult[Optional[List[Control]]]]:
-        args = [title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = self._transport.function_call('AHKWinGetControlList', args, blocking=blocking, engine=self)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (title, text, exclude_title, exclude_text, *suffix)
+        resp = self._call('AHKWinGetControlList', args, blocking=blocking, engine=self)
         return resp
 
     # fmt: off
@@ -1709,37 +1353,9 @@ class AHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[bool, FutureResult[bool]]:
-        args = [title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = self._transport.function_call('AHKWinExist', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (title, text, exclude_title, exclude_text, *suffix)
+        resp = self._call('AHKWinExist', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -1764,37 +1380,9 @@ class AHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[None, FutureResult[None]]:
-        args = [new_title, title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = self._transport.function_call('AHKWinSetTitle', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (new_title, title, text, exclude_title, exclude_text, *suffix)
+        resp = self._call('AHKWinSetTitle', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -1819,37 +1407,9 @@ class AHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[None, FutureResult[None]]:
-        args = [str(toggle), title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = self._transport.function_call('AHKWinSetAlwaysOnTop', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (str(toggle), title, text, exclude_title, exclude_text, *suffix)
+        resp = self._call('AHKWinSetAlwaysOnTop', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -1873,37 +1433,9 @@ class AHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[None, FutureResult[None]]:
-        args = [title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = self._transport.function_call('AHKWinSetBottom', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (title, text, exclude_title, exclude_text, *suffix)
+        resp = self._call('AHKWinSetBottom', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -1927,37 +1459,9 @@ class AHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[None, FutureResult[None]]:
-        args = [title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = self._transport.function_call('AHKWinSetTop', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (title, text, exclude_title, exclude_text, *suffix)
+        resp = self._call('AHKWinSetTop', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -1981,37 +1485,9 @@ class AHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[None, FutureResult[None]]:
-        args = [title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = self._transport.function_call('AHKWinSetDisable', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (title, text, exclude_title, exclude_text, *suffix)
+        resp = self._call('AHKWinSetDisable', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -2035,37 +1511,9 @@ class AHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[None, FutureResult[None]]:
-        args = [title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = self._transport.function_call('AHKWinSetEnable', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (title, text, exclude_title, exclude_text, *suffix)
+        resp = self._call('AHKWinSetEnable', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -2089,37 +1537,9 @@ class AHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[None, FutureResult[None]]:
-        args = [title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = self._transport.function_call('AHKWinSetRedraw', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (title, text, exclude_title, exclude_text, *suffix)
+        resp = self._call('AHKWinSetRedraw', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -2144,37 +1564,9 @@ class AHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[bool, FutureResult[bool]]:
-        args = [style, title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = self._transport.function_call('AHKWinSetStyle', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (style, title, text, exclude_title, exclude_text, *suffix)
+        resp = self._call('AHKWinSetStyle', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -2199,37 +1591,9 @@ class AHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[bool, FutureResult[bool]]:
-        args = [style, title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = self._transport.function_call('AHKWinSetExStyle', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (style, title, text, exclude_title, exclude_text, *suffix)
+        resp = self._call('AHKWinSetExStyle', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -2254,37 +1618,9 @@ class AHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[bool, FutureResult[bool]]:
-        args = [options, title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = self._transport.function_call('AHKWinSetRegion', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (options, title, text, exclude_title, exclude_text, *suffix)
+        resp = self._call('AHKWinSetRegion', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -2309,37 +1645,9 @@ class AHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[None, FutureResult[None]]:
-        args = [str(transparency), title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = self._transport.function_call('AHKWinSetTransparent', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (str(transparency), title, text, exclude_title, exclude_text, *suffix)
+        resp = self._call('AHKWinSetTransparent', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -2364,37 +1672,9 @@ class AHK:
         detect_hidden_windows: Optional[bool] = None,
         blocking: bool = True,
     ) -> Union[None, FutureResult[None]]:
-        args = [str(color), title, text, exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
-        resp = self._transport.function_call('AHKWinSetTransColor', args, blocking=blocking)
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (str(color), title, text, exclude_title, exclude_text, *suffix)
+        resp = self._call('AHKWinSetTransColor', args, blocking=blocking)
         return resp
 
     # alias for backwards compatibility
@@ -2421,11 +1701,10 @@ class AHK:
         blocking: bool = True,
         coord_mode: Optional[CoordModeRelativeTo] = None,
     ) -> Union[None, FutureResult[None]]:
-        button = 'R'
         return self.click(
             x,
             y,
-            button=button,
+            button='R',
             click_count=click_count,
             direction=direction,
             relative=relative,
@@ -2455,23 +1734,20 @@ class AHK:
         blocking: bool = True,
         coord_mode: Optional[CoordModeRelativeTo] = None,
     ) -> Union[None, FutureResult[None]]:
-        if x or y:
-            if y is None and isinstance(x, tuple) and len(x) == 2:
-                #  allow position to be specified by a two-sequence tuple
-                x, y = x
-            assert x is not None and y is not None, 'If provided, position must be specified by x AND y'
+        if y is None and isinstance(x, tuple):
+            #  allow position to be specified by a two-sequence tuple
+            x, y = x
+        assert (x is None) == (y is None), 'If provided, position must be specified by x AND y'
         if button is None:
             button = 'L'
         button = resolve_button(button)
-
-        if relative:
-            r = 'Rel'
+        r = 'Rel' if relative else ''
+        if x is None:
+            position = ('', '')
         else:
-            r = ''
-        if coord_mode is None:
-            coord_mode = ''
-        args = [str(x), str(y), button, str(click_count), direction or '', r, coord_mode]
-        resp = self._transport.function_call('AHKClick', args, blocking=blocking)
+            position = (str(x), str(y))
+        args = (*position, button, str(click_count), direction or '', r, coord_mode or '')
+        resp = self._call('AHKClick', args, blocking=blocking)
         return resp
 
     # fmt: off
@@ -2502,21 +1778,7 @@ class AHK:
         https://www.autohotkey.com/docs/commands/ImageSearch.htm
         """
 
-        if scale_height and not scale_width:
-            scale_width = -1
-        elif scale_width and not scale_height:
-            scale_height = -1
-
-        options: List[Union[str, int]] = []
-        if icon:
-            options.append(f'Icon{icon}')
-        if color_variation is not None:
-            options.append(color_variation)
-        if transparent is not None:
-            options.append(f'Trans{transparent}')
-        if scale_width:
-            options.append(f'w{scale_width}')
-            options.append(f'h{scale_height}')
+        options = _image_search_options(icon, color_variation, transparent, scale_width, scale_height)
 
         x1, y1 = upper_bound
         if lower_bound:
@@ -2524,16 +1786,8 @@ class AHK:
         else:
             x2, y2 = ('A_ScreenWidth', 'A_ScreenHeight')
 
-        args = [str(x1), str(y1), str(x2), str(y2)]
-        if options:
-            s = ''
-            for opt in options:
-                s += f'*{opt} '
-            s += image_path
-            args.append(s)
-        else:
-            args.append(image_path)
-        resp = self._transport.function_call('AHKImageSearch', args, blocking=blocking)
+        args = (str(x1), str(y1), str(x2), str(y2), f'{options}{image_path}')
+        resp = self._call('AHKImageSearch', args, blocking=blocking)
         return resp
 
     def mouse_drag(
@@ -2601,39 +1855,17 @@ class AHK:
         title_match_mode: Optional[TitleMatchMode] = None,
         detect_hidden_windows: Optional[bool] = None,
     ) -> Union[None, FutureResult[None]]:
-        args: List[str]
-        args = [title, text, str(seconds_to_wait) if seconds_to_wait is not None else '', exclude_title, exclude_text]
-        if detect_hidden_windows is not None:
-            if detect_hidden_windows is True:
-                args.append('On')
-            elif detect_hidden_windows is False:
-                args.append('Off')
-            else:
-                raise TypeError(
-                    f'Invalid value for parameter detect_hidden_windows. Expected boolean or None, got {detect_hidden_windows!r}'
-                )
-        else:
-            args.append('')
-        if title_match_mode is not None:
-            if isinstance(title_match_mode, tuple):
-                match_mode, match_speed = title_match_mode
-            elif title_match_mode in (1, 2, 3, 'RegEx'):
-                match_mode = title_match_mode
-                match_speed = ''
-            elif title_match_mode in ('Fast', 'Slow'):
-                match_mode = ''
-                match_speed = title_match_mode
-            else:
-                raise ValueError(
-                    f"Invalid value for title_match_mode argument. Expected 1, 2, 3, 'RegEx', 'Fast', 'Slow' or a tuple of these. Got {title_match_mode!r}"
-                )
-            args.append(str(match_mode))
-            args.append(str(match_speed))
-        else:
-            args.append('')
-            args.append('')
+        suffix = _window_query_suffix(detect_hidden_windows, title_match_mode)
+        args = (
+            title,
+            text,
+            str(seconds_to_wait) if seconds_to_wait is not None else '',
+            exclude_title,
+            exclude_text,
+            *suffix,
+        )
 
-        resp = self._transport.function_call('AHKWinClose', args=args, blocking=blocking)
+        resp = self._call('AHKWinClose', args=args, blocking=blocking)
         return resp
 
     def block_forever(self) -> NoReturn:
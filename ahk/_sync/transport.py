@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio.subprocess
 import atexit
 import os
 import subprocess
@@ -8,17 +7,21 @@ import sys
 import warnings
 from abc import ABC
 from abc import abstractmethod
-from io import BytesIO
+from contextlib import contextmanager
+from contextvars import ContextVar
 from shutil import which
 from typing import Any
 from typing import AnyStr
 from typing import Generic
+from typing import Iterator
 from typing import List
 from typing import Literal
+from typing import Mapping
 from typing import Optional
 from typing import overload
 from typing import Protocol
 from typing import runtime_checkable
+from typing import Sequence
 from typing import Tuple
 from typing import TYPE_CHECKING
 from typing import TypeVar
@@ -58,6 +61,11 @@ class FutureResult(Generic[T_SyncFuture]):
 
 SyncIOProcess: TypeAlias = 'subprocess.Popen[bytes]'
 
+SyncBatchFuture: TypeAlias = 'Future[Any]'
+
+# Windows anonymous pipes buffer about 4KB by default (Linux pipes hold 64KB)
+_BATCH_CHUNK_SIZE = 4096
+
 
 FunctionName = Literal[
     'AHKControlClick',
@@ -168,9 +176,13 @@ class SyncAHKProcess:
 
     def start(self) -> None:
         self._proc = sync_create_process(self.runargs)
-        atexit.register(kill, self._proc)
+        atexit.register(self._kill_at_exit)
         return None
 
+    def _kill_at_exit(self) -> None:
+        if self._proc is not None:
+            kill(self._proc)
+
 
     def drain_stdin(self) -> None:
         assert isinstance(self._proc, subprocess.Popen)
@@ -190,8 +202,24 @@ class SyncAHKProcess:
         assert isinstance(line, bytes)
         return line
 
+    def read_response(self) -> bytes:
+        assert self._proc is not None
+        assert self._proc.stdout is not None
+        # bind the stream's readline once rather than going through self.readline (and its checks) for every line
+        readline = self._proc.stdout.readline
+        tom = readline()
+        num_lines = readline()
+        content = bytearray(tom)
+        content += num_lines
+        for _ in range(int(num_lines) + 1):
+            content += readline()
+        del content[-1:]
+        return bytes(content)
+
     def kill(self) -> None:
         assert self._proc is not None
+        # a process that was explicitly killed no longer needs (nor should stay referenced by) an exit handler
+        atexit.unregister(self._kill_at_exit)
         self._proc.kill()
 
 
@@ -201,6 +229,12 @@ def sync_create_process(runargs: List[str]) -> subprocess.Popen[bytes]:
     return subprocess.Popen(runargs, stdin=subprocess.PIPE, stderr=subprocess.PIPE, stdout=subprocess.PIPE)
 
 
+
+
+def sync_create_future() -> Future[Any]:
+    return Future()
+
+
 class AhkExecutableNotFoundError(EnvironmentError):
     pass
 
@@ -245,13 +279,56 @@ def _resolve_executable_path(executable_path: Union[str, os.PathLike[AnyStr]] =
     return executable_path
 
 
+def _chunk_batch(
+    batch: List[Tuple[RequestMessage, Optional[AHK], SyncBatchFuture]]
+) -> Iterator[Tuple[bytes, List[Tuple[Optional[AHK], SyncBatchFuture]]]]:
+    """
+    Split queued requests into chunks that fit in the daemon's stdin pipe; a larger request is a chunk of its own
+
+    Writing more than that before reading the responses can deadlock: once its stdout pipe is full of unread
+    responses, the daemon stops reading stdin and the write blocks forever.
+    """
+    messages: List[bytes] = []
+    items: List[Tuple[Optional[AHK], SyncBatchFuture]] = []
+    size = 0
+    for request, engine, fut in batch:
+        msg = request.format()
+        if messages and size + len(msg) > _BATCH_CHUNK_SIZE:
+            yield b''.join(messages), items
+            messages, items, size = [], [], 0
+        messages.append(msg)
+        items.append((engine, fut))
+        size += len(msg)
+    if messages:
+        yield b''.join(messages), items
+
+
+class _PendingBatch:
+    """
+    Requests queued by an open batch() block
+
+    Tasks (or contexts) created inside the block keep a reference after it exits, so the batch is marked closed
+    to make their later calls send normally rather than queue requests that are never flushed.
+    """
+
+    __slots__ = ('requests', 'closed')
+
+    def __init__(self) -> None:
+        self.requests: List[Tuple[RequestMessage, Optional[AHK], SyncBatchFuture]] = []
+        self.closed = False
+
+
+# open batches are per-context (per task, or per thread in the sync API), so calls made concurrently from outside
+# a batch block are never swept into it. The mapping is never mutated; opening a batch sets a new one.
+_pending_batches: ContextVar[Mapping[Transport, _PendingBatch]] = ContextVar('ahk_pending_batches', default={})
+
+
 class Transport(ABC):
     _started: bool = False
 
     def __init__(self, /, executable_path: Union[str, os.PathLike[AnyStr]] = '', **kwargs: Any):
         self._executable_path: str = _resolve_executable_path(executable_path=executable_path)
         self._hotkey_transport = ThreadedHotkeyTransport(executable_path=self._executable_path)
-        pass
 
     def add_hotkey(self, hotkey: Hotkey) -> None:
         with warnings.catch_warnings(record=True) as caught_warnings:
@@ -281,161 +358,161 @@ class Transport(ABC):
 
     # fmt: off
     @overload
-    def function_call(self, function_name: Literal['AHKWinExist'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[bool, FutureResult[bool]]: ...
+    def function_call(self, function_name: Literal['AHKWinExist'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[bool, FutureResult[bool]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKImageSearch'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[Tuple[int, int], None, FutureResult[Union[Tuple[int, int], None]]]: ...
+    def function_call(self, function_name: Literal['AHKImageSearch'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[Tuple[int, int], None, FutureResult[Union[Tuple[int, int], None]]]: ...
     @overload
-    def function_call(self, function_name: Literal['PixelGetColor'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[str, FutureResult[str]]: ...
+    def function_call(self, function_name: Literal['PixelGetColor'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[str, FutureResult[str]]: ...
     @overload
-    def function_call(self, function_name: Literal['PixelSearch'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[Tuple[int, int], FutureResult[Tuple[int, int]]]: ...
+    def function_call(self, function_name: Literal['PixelSearch'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[Tuple[int, int], FutureResult[Tuple[int, int]]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKMouseGetPos'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[Tuple[int, int], FutureResult[Tuple[int, int]]]: ...
+    def function_call(self, function_name: Literal['AHKMouseGetPos'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[Tuple[int, int], FutureResult[Tuple[int, int]]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKKeyState'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[bool, FutureResult[bool]]: ...
+    def function_call(self, function_name: Literal['AHKKeyState'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[bool, FutureResult[bool]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKMouseMove'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
+    def function_call(self, function_name: Literal['AHKMouseMove'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
     @overload
-    def function_call(self, function_name: Literal['CoordMode'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
+    def function_call(self, function_name: Literal['CoordMode'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKClick'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
+    def function_call(self, function_name: Literal['AHKClick'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
     @overload
-    def function_call(self, function_name: Literal['MouseClickDrag'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
+    def function_call(self, function_name: Literal['MouseClickDrag'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKKeyWait'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[int, FutureResult[int]]: ...
+    def function_call(self, function_name: Literal['AHKKeyWait'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[int, FutureResult[int]]: ...
     @overload
-    def function_call(self, function_name: Literal['SetKeyDelay'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
+    def function_call(self, function_name: Literal['SetKeyDelay'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKSend'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
+    def function_call(self, function_name: Literal['AHKSend'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKSendRaw'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
+    def function_call(self, function_name: Literal['AHKSendRaw'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKSendInput'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
+    def function_call(self, function_name: Literal['AHKSendInput'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKSendEvent'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
+    def function_call(self, function_name: Literal['AHKSendEvent'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKSendPlay'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
+    def function_call(self, function_name: Literal['AHKSendPlay'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
     @overload
-    def function_call(self, function_name: Literal['SetCapsLockState'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
+    def function_call(self, function_name: Literal['SetCapsLockState'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKWinGetTitle'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[str, FutureResult[str]]: ...
+    def function_call(self, function_name: Literal['AHKWinGetTitle'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[str, FutureResult[str]]: ...
     @overload
-    def function_call(self, function_name: Literal['WinGetClass'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[str, FutureResult[str]]: ...
+    def function_call(self, function_name: Literal['WinGetClass'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[str, FutureResult[str]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKWinGetText'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[str, FutureResult[str]]: ...
+    def function_call(self, function_name: Literal['AHKWinGetText'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[str, FutureResult[str]]: ...
     @overload
-    def function_call(self, function_name: Literal['WinActivate'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
+    def function_call(self, function_name: Literal['WinActivate'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
     @overload
-    def function_call(self, function_name: Literal['WinActivateBottom'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
+    def function_call(self, function_name: Literal['WinActivateBottom'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKWinClose'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
+    def function_call(self, function_name: Literal['AHKWinClose'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
     @overload
-    def function_call(self, function_name: Literal['WinHide'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
+    def function_call(self, function_name: Literal['WinHide'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
     @overload
-    def function_call(self, function_name: Literal['WinKill'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
+    def function_call(self, function_name: Literal['WinKill'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
     @overload
-    def function_call(self, function_name: Literal['WinMaximize'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
+    def function_call(self, function_name: Literal['WinMaximize'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
     @overload
-    def function_call(self, function_name: Literal['WinMinimize'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
+    def function_call(self, function_name: Literal['WinMinimize'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
     @overload
-    def function_call(self, function_name: Literal['WinRestore'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
+    def function_call(self, function_name: Literal['WinRestore'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
     @overload
-    def function_call(self, function_name: Literal['WinShow'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
+    def function_call(self, function_name: Literal['WinShow'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKWindowList'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[List[Window], FutureResult[List[Window]]]: ...
+    def function_call(self, function_name: Literal['AHKWindowList'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[List[Window], FutureResult[List[Window]]]: ...
     @overload
-    def function_call(self, function_name: Literal['WinSend'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
+    def function_call(self, function_name: Literal['WinSend'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
     @overload
-    def function_call(self, function_name: Literal['WinSendRaw'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
+    def function_call(self, function_name: Literal['WinSendRaw'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKControlSend'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
+    def function_call(self, function_name: Literal['AHKControlSend'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
     @overload
-    def function_call(self, function_name: Literal['FromMouse'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[str, FutureResult[str]]: ...
+    def function_call(self, function_name: Literal['FromMouse'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[str, FutureResult[str]]: ...
     @overload
-    def function_call(self, function_name: Literal['WinGet'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[str, FutureResult[str]]: ...
+    def function_call(self, function_name: Literal['WinGet'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[str, FutureResult[str]]: ...
     @overload
-    def function_call(self, function_name: Literal['WinSet'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
+    def function_call(self, function_name: Literal['WinSet'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
     @overload
-    def function_call(self, function_name: Literal['WinSetTitle'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
+    def function_call(self, function_name: Literal['WinSetTitle'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKWinIsAlwaysOnTop'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[Optional[bool], FutureResult[Optional[bool]]]: ...
+    def function_call(self, function_name: Literal['AHKWinIsAlwaysOnTop'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[Optional[bool], FutureResult[Optional[bool]]]: ...
     @overload
-    def function_call(self, function_name: Literal['WinClick'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
+    def function_call(self, function_name: Literal['WinClick'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKWinMove'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
+    def function_call(self, function_name: Literal['AHKWinMove'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKWinGetPos'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[Union[Position, None], FutureResult[Union[None, Position]]]: ...
+    def function_call(self, function_name: Literal['AHKWinGetPos'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[Union[Position, None], FutureResult[Union[None, Position]]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKWinGetID'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[Union[None, Window], FutureResult[Union[None, Window]]]: ...
+    def function_call(self, function_name: Literal['AHKWinGetID'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[Union[None, Window], FutureResult[Union[None, Window]]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKWinGetIDLast'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[Union[None, Window], FutureResult[Union[None, Window]]]: ...
+    def function_call(self, function_name: Literal['AHKWinGetIDLast'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[Union[None, Window], FutureResult[Union[None, Window]]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKWinGetPID'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[Union[int, None], FutureResult[Union[int, None]]]: ...
+    def function_call(self, function_name: Literal['AHKWinGetPID'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[Union[int, None], FutureResult[Union[int, None]]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKWinGetProcessName'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[Union[None, str], FutureResult[Union[None, str]]]: ...
+    def function_call(self, function_name: Literal['AHKWinGetProcessName'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[Union[None, str], FutureResult[Union[None, str]]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKWinGetProcessPath'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[Union[None, str], FutureResult[Union[None, str]]]: ...
+    def function_call(self, function_name: Literal['AHKWinGetProcessPath'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[Union[None, str], FutureResult[Union[None, str]]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKWinGetCount'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[int, FutureResult[int]]: ...
+    def function_call(self, function_name: Literal['AHKWinGetCount'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[int, FutureResult[int]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKWinGetList'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[List[Window], FutureResult[List[Window]]]: ...
+    def function_call(self, function_name: Literal['AHKWinGetList'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[List[Window], FutureResult[List[Window]]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKWinGetMinMax'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[Union[None, int], FutureResult[Union[None, int]]]: ...
+    def function_call(self, function_name: Literal['AHKWinGetMinMax'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[Union[None, int], FutureResult[Union[None, int]]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKWinGetControlList'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[List[Control], None, FutureResult[Union[List[Control], None]]]: ...
+    def function_call(self, function_name: Literal['AHKWinGetControlList'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[List[Control], None, FutureResult[Union[List[Control], None]]]: ...
     # @overload
-    # async def function_call(self, function_name: Literal['AHKWinGetControlListHwnd'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[List[AsyncControl], AsyncFutureResult[List[AsyncControl]]]: ...
+    # async def function_call(self, function_name: Literal['AHKWinGetControlListHwnd'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AsyncAHK] = None) -> Union[List[AsyncControl], AsyncFutureResult[List[AsyncControl]]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKWinGetTransparent'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[Union[None, int], FutureResult[Union[None, int]]]: ...
+    def function_call(self, function_name: Literal['AHKWinGetTransparent'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[Union[None, int], FutureResult[Union[None, int]]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKWinGetTransColor'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[Union[None, str], FutureResult[Union[None, str]]]: ...
+    def function_call(self, function_name: Literal['AHKWinGetTransColor'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[Union[None, str], FutureResult[Union[None, str]]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKWinGetStyle'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[Union[None, str], FutureResult[Union[None, str]]]: ...
+    def function_call(self, function_name: Literal['AHKWinGetStyle'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[Union[None, str], FutureResult[Union[None, str]]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKWinGetExStyle'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[Union[None, str], FutureResult[Union[None, str]]]: ...
+    def function_call(self, function_name: Literal['AHKWinGetExStyle'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[Union[None, str], FutureResult[Union[None, str]]]: ...
 
     @overload
-    def function_call(self, function_name: Literal['AHKWinSetAlwaysOnTop'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
+    def function_call(self, function_name: Literal['AHKWinSetAlwaysOnTop'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKWinSetBottom'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
+    def function_call(self, function_name: Literal['AHKWinSetBottom'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKWinSetTop'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
+    def function_call(self, function_name: Literal['AHKWinSetTop'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKWinSetDisable'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
+    def function_call(self, function_name: Literal['AHKWinSetDisable'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKWinSetEnable'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
+    def function_call(self, function_name: Literal['AHKWinSetEnable'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKWinSetRedraw'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
+    def function_call(self, function_name: Literal['AHKWinSetRedraw'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKWinSetStyle'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[bool, FutureResult[bool]]: ...
+    def function_call(self, function_name: Literal['AHKWinSetStyle'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[bool, FutureResult[bool]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKWinSetExStyle'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[bool, FutureResult[bool]]: ...
+    def function_call(self, function_name: Literal['AHKWinSetExStyle'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[bool, FutureResult[bool]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKWinSetRegion'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[bool, FutureResult[bool]]: ...
+    def function_call(self, function_name: Literal['AHKWinSetRegion'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[bool, FutureResult[bool]]: ...
 
     @overload
-    def function_call(self, function_name: Literal['AHKWinSetTransparent'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
+    def function_call(self, function_name: Literal['AHKWinSetTransparent'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKWinSetTransColor'], args: Optional[List[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
+    def function_call(self, function_name: Literal['AHKWinSetTransColor'], args: Optional[Sequence[str]] = None, *, blocking: bool = True, engine: Optional[AHK] = None) -> Union[None, FutureResult[None]]: ...
 
     @overload
-    def function_call(self, function_name: Literal['AHKSetDetectHiddenWindows'], args: Optional[List[str]] = None) -> None: ...
+    def function_call(self, function_name: Literal['AHKSetDetectHiddenWindows'], args: Optional[Sequence[str]] = None) -> None: ...
     @overload
-    def function_call(self, function_name: Literal['AHKWinSetTitle'], args: Optional[List[str]] = None, *, blocking: bool = True) -> Union[None, FutureResult[None]]: ...
+    def function_call(self, function_name: Literal['AHKWinSetTitle'], args: Optional[Sequence[str]] = None, *, blocking: bool = True) -> Union[None, FutureResult[None]]: ...
     @overload
-    def function_call(self, function_name: Literal['AHKSetTitleMatchMode'], args: Optional[List[str]] = None) -> None: ...
+    def function_call(self, function_name: Literal['AHKSetTitleMatchMode'], args: Optional[Sequence[str]] = None) -> None: ...
     @overload
     def function_call(self, function_name: Literal['AHKGetTitleMatchMode']) -> str: ...
     @overload
     def function_call(self, function_name: Literal['AHKGetTitleMatchSpeed']) -> str: ...
 
     @overload
-    def function_call(self, function_name: Literal['AHKControlGetText'], args: Optional[List[str]] = None, *, engine: Optional[AHK] = None, blocking: bool = True) -> Union[str, FutureResult[str]]: ...
+    def function_call(self, function_name: Literal['AHKControlGetText'], args: Optional[Sequence[str]] = None, *, engine: Optional[AHK] = None, blocking: bool = True) -> Union[str, FutureResult[str]]: ...
 
     @overload
-    def function_call(self, function_name: Literal['AHKControlClick'], args: Optional[List[str]] = None, *, blocking: bool = True) -> Union[None, FutureResult[None]]: ...
+    def function_call(self, function_name: Literal['AHKControlClick'], args: Optional[Sequence[str]] = None, *, blocking: bool = True) -> Union[None, FutureResult[None]]: ...
 
     @overload
-    def function_call(self, function_name: Literal['AHKControlGetPos'], args: Optional[List[str]] = None, *, blocking: bool = True) -> Union[Position, FutureResult[Position]]: ...
+    def function_call(self, function_name: Literal['AHKControlGetPos'], args: Optional[Sequence[str]] = None, *, blocking: bool = True) -> Union[Position, FutureResult[Position]]: ...
 
     @overload
     def function_call(self, function_name: Literal['AHKGetCoordMode'], args: List[str]) -> str: ...
@@ -444,43 +521,111 @@ class Transport(ABC):
     def function_call(self, function_name: Literal['AHKSetCoordMode'], args: List[str]) -> None: ...
 
     # @overload
-    # async def function_call(self, function_name: Literal['HideTrayTip'], args: Optional[List[str]] = None) -> None: ...
+    # async def function_call(self, function_name: Literal['HideTrayTip'], args: Optional[Sequence[str]] = None) -> None: ...
     # @overload
-    # async def function_call(self, function_name: Literal['BaseCheck'], args: Optional[List[str]] = None) -> None: ...
+    # async def function_call(self, function_name: Literal['BaseCheck'], args: Optional[Sequence[str]] = None) -> None: ...
     # @overload
-    # async def function_call(self, function_name: Literal['WinWait'], args: Optional[List[str]] = None) -> str: ...
+    # async def function_call(self, function_name: Literal['WinWait'], args: Optional[Sequence[str]] = None) -> str: ...
     # @overload
-    # async def function_call(self, function_name: Literal['WinWaitActive'], args: Optional[List[str]] = None) -> str: ...
+    # async def function_call(self, function_name: Literal['WinWaitActive'], args: Optional[Sequence[str]] = None) -> str: ...
     # @overload
-    # async def function_call(self, function_name: Literal['WinWaitNotActive'], args: Optional[List[str]] = None) -> str: ...
+    # async def function_call(self, function_name: Literal['WinWaitNotActive'], args: Optional[Sequence[str]] = None) -> str: ...
     # @overload
-    # async def function_call(self, function_name: Literal['WinWaitClose'], args: Optional[List[str]] = None) -> None: ...
+    # async def function_call(self, function_name: Literal['WinWaitClose'], args: Optional[Sequence[str]] = None) -> None: ...
     # @overload
-    # async def function_call(self, function_name: Literal['RegRead'], args: Optional[List[str]] = None) -> None: ...
+    # async def function_call(self, function_name: Literal['RegRead'], args: Optional[Sequence[str]] = None) -> None: ...
     # @overload
-    # async def function_call(self, function_name: Literal['SetRegView'], args: Optional[List[str]] = None) -> None: ...
+    # async def function_call(self, function_name: Literal['SetRegView'], args: Optional[Sequence[str]] = None) -> None: ...
     # @overload
-    # async def function_call(self, function_name: Literal['RegWrite'], args: Optional[List[str]] = None) -> None: ...
+    # async def function_call(self, function_name: Literal['RegWrite'], args: Optional[Sequence[str]] = None) -> None: ...
     # @overload
-    # async def function_call(self, function_name: Literal['RegDelete'], args: Optional[List[str]] = None) -> None: ...
+    # async def function_call(self, function_name: Literal['RegDelete'], args: Optional[Sequence[str]] = None) -> None: ...
 
     # fmt: on
 
     def function_call(
         self,
         function_name: FunctionName,
-        args: Optional[List[str]] = None,
+        args: Optional[Sequence[str]] = None,
         blocking: bool = True,
         engine: Optional[AHK] = None,
     ) -> Any:
         if not self._started:
             self.init()
         request = RequestMessage(function_name=function_name, args=args)
+        pending = self._current_batch()
         if blocking:
+            if pending is not None and pending.requests:
+                self.flush()
             return self.send(request, engine=engine)
+        elif pending is not None:
+            return self._queue_request(pending, request, engine=engine)
         else:
             return self.send_nonblocking(request, engine=engine)
 
+    def _current_batch(self) -> Optional[_PendingBatch]:
+        pending = _pending_batches.get().get(self)
+        if pending is None or pending.closed:
+            return None
+        return pending
+
+    def _queue_request(
+        self,
+        pending: _PendingBatch,
+        request: RequestMessage,
+        engine: Optional[AHK] = None,
+    ) -> FutureResult[
+        Union[None, Tuple[int, int], int, str, bool, Window, List[Window], List[Control]]
+    ]:
+        fut = sync_create_future()
+        pending.requests.append((request, engine, fut))
+        return FutureResult(fut)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Queue non-blocking calls made within the block and send them together when the block exits.
+
+        Only calls made from the same task (or thread, in the sync API) are queued. Nested batches are merged
+        into the outermost one. If the block raises, queued calls are not sent and their futures are cancelled.
+        """
+        if self._current_batch() is not None:
+            yield
+            return
+        pending = _PendingBatch()
+        token = _pending_batches.set({**_pending_batches.get(), self: pending})
+        try:
+            yield
+            # tasks created in the block may queue more calls while earlier ones are being sent
+            while pending.requests:
+                self.flush()
+        finally:
+            pending.closed = True
+            _pending_batches.reset(token)
+            for _, _, fut in pending.requests:
+                fut.cancel()
+
+    def flush(self) -> None:
+        """
+        Send any calls queued by the current batch and resolve their futures.
+        """
+        pending = self._current_batch()
+        if pending is None or not pending.requests:
+            return None
+        batch, pending.requests = pending.requests, []
+        self._send_batch(batch)
+        return None
+
+    def _send_batch(self, batch: List[Tuple[RequestMessage, Optional[AHK], SyncBatchFuture]]) -> None:
+        for request, engine, fut in batch:
+            try:
+                result = self.send(request, engine=engine)
+            except Exception as e:
+                fut.set_exception(e)
+            else:
+                fut.set_result(result)
+        return None
+
     @abstractmethod
     def send(
         self, request: RequestMessage, engine: Optional[AHK] = None
@@ -528,15 +673,7 @@ class DaemonProcessTransport(Transport):
         try:
             proc.write(msg)
             proc.drain_stdin()
-            tom = proc.readline()
-            num_lines = proc.readline()
-            content_buffer = BytesIO()
-            content_buffer.write(tom)
-            content_buffer.write(num_lines)
-            for _ in range(int(num_lines) + 1):
-                part = proc.readline()
-                content_buffer.write(part)
-            content = content_buffer.getvalue()[:-1]
+            content = proc.read_response()
         except Exception:
             raise
         finally:
@@ -567,18 +704,32 @@ class DaemonProcessTransport(Transport):
         assert self._proc is not None
         self._proc.write(msg)
         self._proc.drain_stdin()
-        tom = self._proc.readline()
-        num_lines = self._proc.readline()
-        content_buffer = BytesIO()
-        content_buffer.write(tom)
-        content_buffer.write(num_lines)
-        for _ in range(int(num_lines) + 1):
-            part = self._proc.readline()
-            content_buffer.write(part)
-        content = content_buffer.getvalue()[:-1]
+        content = self._proc.read_response()
         response = ResponseMessage.from_bytes(content, engine=engine)
         return response.unpack()  # type: ignore
 
+    def _send_batch(self, batch: List[Tuple[RequestMessage, Optional[AHK], SyncBatchFuture]]) -> None:
+        # the daemon handles requests in order, so each chunk is written in one go before reading its responses
+        assert self._proc is not None
+        try:
+            for chunk, items in _chunk_batch(batch):
+                self._proc.write(chunk)
+                self._proc.drain_stdin()
+                for engine, fut in items:
+                    content = self._proc.read_response()
+                    # a bad response only fails its own call; the rest must still be read off the daemon's stdout
+                    try:
+                        response = ResponseMessage.from_bytes(content, engine=engine)
+                        fut.set_result(response.unpack())
+                    except Exception as e:
+                        fut.set_exception(e)
+        except BaseException as e:
+            for _, _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(e)
+            raise
+        return None
+
 
 if TYPE_CHECKING:
     from .engine import AHK
@@ -43,11 +43,14 @@ _SETTERS_REMOVED_ERROR_MESSAGE = (
 
 
 class Window:
+    __slots__ = ('_engine', '_ahk_id', '_win_title')
+
     def __init__(self, engine: AHK, ahk_id: str):
         self._engine: AHK = engine
         if not ahk_id:
             raise ValueError(f'Invalid ahk_id: {ahk_id!r}')
         self._ahk_id: str = ahk_id
+        self._win_title: str = f'ahk_id {ahk_id}'
 
     def __repr__(self) -> str:
         return f'<{self.__class__.__qualname__} ahk_id={self._ahk_id}>'
@@ -60,15 +63,24 @@ class Window:
     def __hash__(self) -> int:
         return hash(self._ahk_id)
 
-    def close(self) -> None:
-        self._engine.win_close(
-            title=f'ahk_id {self._ahk_id}', detect_hidden_windows=True, title_match_mode=(1, 'Fast')
+    # fmt: off
+    @overload
+    def close(self) -> None: ...
+    @overload
+    def close(self, *, blocking: Literal[False]) -> FutureResult[None]: ...
+    @overload
+    def close(self, *, blocking: Literal[True]) -> None: ...
+    @overload
+    def close(self, *, blocking: bool = True) -> Union[None, FutureResult[None]]: ...
+    # fmt: on
+    def close(self, *, blocking: bool = True) -> Union[None, FutureResult[None]]:
+        return self._engine.win_close(
+            title=self._win_title, blocking=blocking, detect_hidden_windows=True, title_match_mode=(1, 'Fast')
         )
-        return None
 
     def exists(self) -> bool:
         return self._engine.win_exists(
-            title=f'ahk_id {self._ahk_id}', detect_hidden_windows=True, title_match_mode=(1, 'Fast')
+            title=self._win_title, detect_hidden_windows=True, title_match_mode=(1, 'Fast')
         )
 
     @property
@@ -81,7 +93,7 @@ class Window:
 
     def get_pid(self) -> int:
         pid = self._engine.win_get_pid(
-            title=f'ahk_id {self._ahk_id}', detect_hidden_windows=True, title_match_mode=(1, 'Fast')
+            title=self._win_title, detect_hidden_windows=True, title_match_mode=(1, 'Fast')
         )
         if pid is None:
             raise WindowNotFoundException(
@@ -95,7 +107,7 @@ class Window:
 
     def get_process_name(self) -> str:
         name = self._engine.win_get_process_name(
-            title=f'ahk_id {self._ahk_id}', detect_hidden_windows=True, title_match_mode=(1, 'Fast')
+            title=self._win_title, detect_hidden_windows=True, title_match_mode=(1, 'Fast')
         )
         if name is None:
             raise WindowNotFoundException(
@@ -109,7 +121,7 @@ class Window:
 
     def get_process_path(self) -> str:
         path = self._engine.win_get_process_path(
-            title=f'ahk_id {self._ahk_id}', detect_hidden_windows=True, title_match_mode=(1, 'Fast')
+            title=self._win_title, detect_hidden_windows=True, title_match_mode=(1, 'Fast')
         )
         if path is None:
             raise WindowNotFoundException(
@@ -123,7 +135,7 @@ class Window:
 
     def get_minmax(self) -> int:
         minmax = self._engine.win_get_minmax(
-            title=f'ahk_id {self._ahk_id}', detect_hidden_windows=True, title_match_mode=(1, 'Fast')
+            title=self._win_title, detect_hidden_windows=True, title_match_mode=(1, 'Fast')
         )
         if minmax is None:
             raise WindowNotFoundException(
@@ -133,7 +145,7 @@ class Window:
 
     def get_title(self) -> str:
         title = self._engine.win_get_title(
-            title=f'ahk_id {self._ahk_id}', detect_hidden_windows=True, title_match_mode=(1, 'Fast')
+            title=self._win_title, detect_hidden_windows=True, title_match_mode=(1, 'Fast')
         )
         return title
 
@@ -145,18 +157,28 @@ class Window:
     def title(self, value: str) -> Any:
         self.set_title(value)
 
-    def set_title(self, new_title: str) -> None:
-        self._engine.win_set_title(
-            title=f'ahk_id {self._ahk_id}',
+    # fmt: off
+    @overload
+    def set_title(self, new_title: str) -> None: ...
+    @overload
+    def set_title(self, new_title: str, *, blocking: Literal[False]) -> FutureResult[None]: ...
+    @overload
+    def set_title(self, new_title: str, *, blocking: Literal[True]) -> None: ...
+    @overload
+    def set_title(self, new_title: str, *, blocking: bool = True) -> Union[None, FutureResult[None]]: ...
+    # fmt: on
+    def set_title(self, new_title: str, *, blocking: bool = True) -> Union[None, FutureResult[None]]:
+        return self._engine.win_set_title(
+            title=self._win_title,
+            blocking=blocking,
             detect_hidden_windows=True,
             new_title=new_title,
             title_match_mode=(1, 'Fast'),
         )
-        return None
 
     def list_controls(self) -> Sequence['Control']:
         controls = self._engine.win_get_control_list(
-            title=f'ahk_id {self._ahk_id}', detect_hidden_windows=True, title_match_mode=(1, 'Fast')
+            title=self._win_title, detect_hidden_windows=True, title_match_mode=(1, 'Fast')
         )
         if controls is None:
             raise WindowNotFoundException(
@@ -179,7 +201,7 @@ class Window:
     ) -> Union[None, FutureResult[None]]:
         return self._engine.win_set_always_on_top(
             toggle=toggle,
-            title=f'ahk_id {self._ahk_id}',
+            title=self._win_title,
             blocking=blocking,
             detect_hidden_windows=True,
             title_match_mode=(1, 'Fast'),
@@ -196,10 +218,9 @@ class Window:
     def is_always_on_top(self, *, blocking: bool = True) -> Union[bool, FutureResult[Optional[bool]]]: ...
     # fmt: on
     def is_always_on_top(self, *, blocking: bool = True) -> Union[bool, FutureResult[Optional[bool]]]:
-        args = [f'ahk_id {self._ahk_id}']
-        resp = self._engine._transport.function_call(
-            'AHKWinIsAlwaysOnTop', args, blocking=blocking
-        )  # XXX: maybe shouldn't access transport directly?
+        args = (self._win_title,)
+        # uses the engine's private _call shortcut; there is no public engine method for this query
+        resp = self._engine._call('AHKWinIsAlwaysOnTop', args, blocking=blocking)
         if resp is None:
             raise WindowNotFoundException(
                 f'Error when trying to get always on top style for window {self._ahk_id}. The window may have been closed before the operation could be completed'
@@ -227,7 +248,7 @@ class Window:
     def send(self, keys: str, *, blocking: bool = True) -> Union[None, FutureResult[None]]:
         return self._engine.control_send(
             keys=keys,
-            title=f'ahk_id {self._ahk_id}',
+            title=self._win_title,
             blocking=blocking,
             detect_hidden_windows=True,
             title_match_mode=(1, 'Fast'),
@@ -245,7 +266,7 @@ class Window:
     # fmt: on
     def get_text(self, *, blocking: bool = True) -> Union[str, FutureResult[str]]:
         return self._engine.win_get_text(
-            title=f'ahk_id {self._ahk_id}', blocking=blocking, detect_hidden_windows=True, title_match_mode=(1, 'Fast')
+            title=self._win_title, blocking=blocking, detect_hidden_windows=True, title_match_mode=(1, 'Fast')
         )
 
     @property
@@ -264,7 +285,7 @@ class Window:
     # fmt: on
     def get_position(self, blocking: bool = True) -> Union[Position, FutureResult[Optional[Position]]]:
         resp = self._engine.win_get_position(
-            title=f'ahk_id {self._ahk_id}',
+            title=self._win_title,
             blocking=blocking,
             detect_hidden_windows=True,
             title_match_mode=(1, 'Fast'),
@@ -277,6 +298,8 @@ class Window:
 
 
 class Control:
+    __slots__ = ('window', 'hwnd', 'control_class', '_engine')
+
     def __init__(self, window: Window, hwnd: str, control_class: str):
         self.window: Window = window
         self.hwnd: str = hwnd
@@ -306,7 +329,7 @@ class Control:
             control=self.control_class,
             click_count=click_count,
             options=options,
-            title=f'ahk_id {self.window._ahk_id}',
+            title=self.window._win_title,
             title_match_mode=(1, 'Fast'),
             detect_hidden_windows=True,
             blocking=blocking,
@@ -326,7 +349,7 @@ class Control:
         return self._engine.control_send(
             keys=keys,
             control=self.control_class,
-            title=f'ahk_id {self.window._ahk_id}',
+            title=self.window._win_title,
             blocking=blocking,
             detect_hidden_windows=True,
             title_match_mode=(1, 'Fast'),
@@ -335,7 +358,7 @@ class Control:
     def get_text(self, blocking: bool = True) -> Union[str, FutureResult[str]]:
         return self._engine.control_get_text(
             control=self.control_class,
-            title=f'ahk_id {self.window._ahk_id}',
+            title=self.window._win_title,
             blocking=blocking,
             detect_hidden_windows=True,
             title_match_mode=(1, 'Fast'),
@@ -354,7 +377,7 @@ class Control:
     def get_position(self, blocking: bool = True) -> Union[Position, FutureResult[Position]]:
         return self._engine.control_get_position(
             control=self.control_class,
-            title=f'ahk_id {self.window._ahk_id}',
+            title=self.window._win_title,
             blocking=blocking,
             detect_hidden_windows=True,
             title_match_mode=(1, 'Fast'),
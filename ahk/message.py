@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import ast
+import functools
 import itertools
 import string
 import sys
@@ -8,13 +9,13 @@ from abc import abstractmethod
 from base64 import b64encode
 from collections import namedtuple
 from typing import Any
-from typing import cast
 from typing import Generator
 from typing import List
 from typing import NoReturn
 from typing import Optional
 from typing import Protocol
 from typing import runtime_checkable
+from typing import Sequence
 from typing import Tuple
 from typing import Type
 from typing import TYPE_CHECKING
@@ -89,9 +90,9 @@ T_ResponseMessageType = TypeVar('T_ResponseMessageType', bound='ResponseMessage'
 
 
 def tom_generator() -> Generator[bytes, None, None]:
-    characters = string.digits + string.ascii_letters
+    characters = (string.digits + string.ascii_letters).encode('ascii')
     for a, b, c in itertools.product(characters, characters, characters):
-        yield bytes(f'{a}{b}{c}', encoding='ascii')
+        yield bytes((a, b, c))
     raise OutOfMessageTypes('Out of TOMS')
 
 
@@ -99,6 +100,7 @@ TOMS = tom_generator()
 
 
 class ResponseMessage:
+    __slots__ = ('_raw_content', '_engine')
     type: Optional[str] = None
     _type_order_mark = next(TOMS)
 
@@ -129,13 +131,17 @@ class ResponseMessage:
     def from_bytes(
         cls: Type[T_ResponseMessageType], b: bytes, engine: Optional[Union[AsyncAHK, AHK]] = None
     ) -> 'ResponseMessageTypes':
-        tom, _, message_bytes = b.split(b'\n', 2)
+        # slice out the TOM and payload around the first two newlines rather than splitting into three new objects
+        tom_end = b.index(b'\n')
+        content_start = b.index(b'\n', tom_end + 1) + 1
+        tom = b[:tom_end]
+        message_bytes = b[content_start:]
         klass = cls._tom_lookup(tom)
         return klass(raw_content=message_bytes, engine=engine)
 
     def to_bytes(self) -> bytes:
         content_lines = self._raw_content.count(b'\n')
-        return self._type_order_mark + b'\n' + bytes(str(content_lines), 'ascii') + b'\n' + self._raw_content
+        return b''.join([self._type_order_mark, b'\n', str(content_lines).encode('ascii'), b'\n', self._raw_content])
 
     @abstractmethod
     def unpack(self) -> Any:
@@ -146,7 +152,21 @@ _message_registry: dict[bytes, 'ResponseMessageClassTypes']
 _message_registry = {ResponseMessage._type_order_mark: ResponseMessage}
 
 
+@functools.lru_cache(maxsize=None)
+def _api_classes() -> Tuple[
+    Type[AsyncAHK], Type[AHK], Type[AsyncWindow], Type[Window], Type[AsyncControl], Type[Control]
+]:
+    # imported lazily (the engine modules import this module) and only once, rather than on every unpack
+    from ._async.engine import AsyncAHK
+    from ._async.window import AsyncWindow, AsyncControl
+    from ._sync.window import Window, Control
+    from ._sync.engine import AHK
+
+    return AsyncAHK, AHK, AsyncWindow, Window, AsyncControl, Control
+
+
 class TupleResponseMessage(ResponseMessage):
+    __slots__ = ()
     type = 'tuple'
 
     def unpack(self) -> Tuple[Any, ...]:
@@ -156,37 +176,46 @@ class TupleResponseMessage(ResponseMessage):
         return val
 
 
+def _parse_int_tuple(raw_content: bytes) -> Tuple[int, ...]:
+    # the daemon formats these as '(1, 2, ...)'; int() accepts the bytes (and surrounding whitespace) directly
+    return tuple(int(part) for part in raw_content.strip().strip(b'()').split(b','))
+
+
 class CoordinateResponseMessage(ResponseMessage):
+    __slots__ = ()
     type = 'coordinate'
 
     def unpack(self) -> Tuple[int, int]:
-        s = self._raw_content.decode(encoding='utf-8')
-        val = ast.literal_eval(s)
-        assert isinstance(val, tuple)
-        x, y = cast(Tuple[int, int], val)
+        x, y = _parse_int_tuple(self._raw_content)
         return x, y
 
 
 class IntegerResponseMessage(ResponseMessage):
+    __slots__ = ()
     type = 'integer'
 
     def unpack(self) -> int:
-        s = self._raw_content.decode(encoding='utf-8')
-        val = ast.literal_eval(s)
-        assert isinstance(val, int)
-        return val
+        # base 0 accepts the same integer literals as ast.literal_eval did, without the parser overhead
+        return int(self._raw_content, 0)
 
 
 class BooleanResponseMessage(IntegerResponseMessage):
+    __slots__ = ()
     type = 'boolean'
 
     def unpack(self) -> bool:
+        # the daemon sends exactly b'1' or b'0'; anything else goes through the integer parse and its check
+        if self._raw_content == b'1':
+            return True
+        elif self._raw_content == b'0':
+            return False
         val = super().unpack()
         assert val in (1, 0)
         return bool(val)
 
 
 class StringResponseMessage(ResponseMessage):
+    __slots__ = ()
     type = 'string'
 
     def unpack(self) -> str:
@@ -194,13 +223,11 @@ class StringResponseMessage(ResponseMessage):
 
 
 class WindowListResponseMessage(ResponseMessage):
+    __slots__ = ()
     type = 'windowlist'
 
     def unpack(self) -> Union[List[Window], List[AsyncWindow]]:
-        from ._async.engine import AsyncAHK
-        from ._async.window import AsyncWindow
-        from ._sync.window import Window
-        from ._sync.engine import AHK
+        AsyncAHK, AHK, AsyncWindow, Window, _, _ = _api_classes()
 
         s = self._raw_content.decode(encoding='utf-8')
         s = s.rstrip(',')
@@ -216,6 +243,7 @@ class WindowListResponseMessage(ResponseMessage):
 
 
 class NoValueResponseMessage(ResponseMessage):
+    __slots__ = ()
     type = 'novalue'
 
     def unpack(self) -> None:
@@ -228,6 +256,7 @@ class AHKExecutionException(Exception):
 
 
 class ExceptionResponseMessage(ResponseMessage):
+    __slots__ = ()
     type = 'exception'
 
     def unpack(self) -> NoReturn:
@@ -236,13 +265,11 @@ class ExceptionResponseMessage(ResponseMessage):
 
 
 class WindowControlListResponseMessage(ResponseMessage):
+    __slots__ = ()
     type = 'windowcontrollist'
 
     def unpack(self) -> Union[List[AsyncControl], List[Control]]:
-        from ._async.engine import AsyncAHK
-        from ._async.window import AsyncWindow, AsyncControl
-        from ._sync.window import Window, Control
-        from ._sync.engine import AHK
+        AsyncAHK, AHK, AsyncWindow, Window, AsyncControl, Control = _api_classes()
 
         s = self._raw_content.decode(encoding='utf-8')
         val = ast.literal_eval(s)
@@ -251,33 +278,23 @@ class WindowControlListResponseMessage(ResponseMessage):
         assert val is not None
         ahkid, controls = val
         if isinstance(self._engine, AsyncAHK):
-            ret_async: List[AsyncControl] = []
             async_window = AsyncWindow(engine=self._engine, ahk_id=ahkid)
-            for control in controls:
-                hwnd, classname = control
-                async_ctrl = AsyncControl(window=async_window, hwnd=hwnd, control_class=classname)
-                ret_async.append(async_ctrl)
-            return ret_async
+            return [
+                AsyncControl(window=async_window, hwnd=hwnd, control_class=classname) for hwnd, classname in controls
+            ]
         elif isinstance(self._engine, AHK):
-            ret_sync: List[Control] = []
             window = Window(engine=self._engine, ahk_id=ahkid)
-            for control in controls:
-                hwnd, classname = control
-                ctrl = Control(window=window, hwnd=hwnd, control_class=classname)
-                ret_sync.append(ctrl)
-            return ret_sync
+            return [Control(window=window, hwnd=hwnd, control_class=classname) for hwnd, classname in controls]
         else:
             raise ValueError(f'Invalid engine: {self._engine!r}')
 
 
 class WindowResponseMessage(ResponseMessage):
+    __slots__ = ()
     type = 'window'
 
     def unpack(self) -> Union[Window, AsyncWindow]:
-        from ._async.engine import AsyncAHK
-        from ._async.window import AsyncWindow
-        from ._sync.window import Window
-        from ._sync.engine import AHK
+        AsyncAHK, AHK, AsyncWindow, Window, _, _ = _api_classes()
 
         s = self._raw_content.decode(encoding='utf-8')
         ahk_id = s.strip()
@@ -292,10 +309,11 @@ class WindowResponseMessage(ResponseMessage):
 
 
 class PositionResponseMessage(TupleResponseMessage):
+    __slots__ = ()
     type = 'position'
 
     def unpack(self) -> Position:
-        resp = super().unpack()
+        resp = _parse_int_tuple(self._raw_content)
         if not len(resp) == 4:
             raise ValueError(f'Unexpected response. Expected tuple of length 4, got tuple of length {len(resp)}')
         pos = Position(*resp)
@@ -305,15 +323,21 @@ class PositionResponseMessage(TupleResponseMessage):
 T_RequestMessageType = TypeVar('T_RequestMessageType', bound='RequestMessage')
 
 
+@functools.lru_cache(maxsize=None)
+def _request_prefix(function_name: str) -> bytes:
+    # the set of daemon function names is small and fixed, so every distinct prefix is kept
+    return function_name.encode('UTF-8') + b'|'
+
+
 class RequestMessage:
-    def __init__(self, function_name: str, args: Optional[List[str]] = None):
+    def __init__(self, function_name: str, args: Optional[Sequence[str]] = None):
         self.function_name: str = function_name
-        self.args: List[str] = args or []
+        self.args: Sequence[str] = args or ()
 
     def format(self) -> bytes:
-        arg_binary = b'|'.join(b64encode(bytes(arg, 'UTF-8')) for arg in self.args)
-        ret = bytes(self.function_name, 'UTF-8') + b'|' + arg_binary + b'\n'
-        return ret
+        # empty arguments (e.g. the default title/text filters) are common and encode to nothing
+        args = b'|'.join([b64encode(arg.encode('UTF-8')) if arg else b'' for arg in self.args])
+        return b''.join([_request_prefix(self.function_name), args, b'\n'])
 
 
 ResponseMessageTypes = Union[
@@ -13,6 +13,7 @@ build_py = unasync.cmdclass_build_py(
                 'AsyncDaemonProcessTransport': 'DaemonProcessTransport',
                 '_AIOP': '_SIOP',
                 'async_create_process': 'sync_create_process',
+                'async_create_future': 'sync_create_future',
                 'adrain_stdin': 'drain_stdin',
                 'a_send_nonblocking': 'send_nonblocking',
                 'async_sleep': 'sleep',
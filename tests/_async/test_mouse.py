@@ -35,6 +35,15 @@ class TestMouseAsync(IsolatedAsyncioTestCase):
         pos2 = await self.ahk.get_mouse_position()
         assert pos2 == (200, 200)
 
+    async def test_mouse_move_partial(self) -> None:
+        await self.ahk.mouse_move(x=100, y=100)
+        await self.ahk.mouse_move(x=200)
+        pos = await self.ahk.get_mouse_position()
+        assert pos == (200, 100)
+        await self.ahk.mouse_move(y=0)
+        pos2 = await self.ahk.get_mouse_position()
+        assert pos2 == (200, 0)
+
     async def test_mouse_move_rel(self):
         await self.ahk.mouse_move(x=100, y=100)
         await async_sleep(0.5)
@@ -57,3 +66,7 @@ class TestMouseAsync(IsolatedAsyncioTestCase):
         assert pos != current_pos
         assert pos != (500, 500)
         await res.result()
+
+    async def test_click_requires_x_and_y(self):
+        with self.assertRaises(AssertionError):
+            await self.ahk.click(0)
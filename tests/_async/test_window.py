@@ -58,6 +58,13 @@ class TestWindowAsync(IsolatedAsyncioTestCase):
         minmax = await self.win.get_minmax()
         assert minmax == 0
 
+    async def test_batch(self):
+        async with self.ahk.batch():
+            pid = await self.ahk.win_get_pid(title='Untitled - Notepad', blocking=False)
+            process_name = await self.ahk.win_get_process_name(title='Untitled - Notepad', blocking=False)
+        assert isinstance(await pid.result(), int)
+        assert await process_name.result() == 'notepad.exe'
+
     async def test_win_set_always_on_top(self):
         assert await self.win.is_always_on_top() is False
         await self.win.set_always_on_top('On')
@@ -106,6 +113,12 @@ class TestWindowAsync(IsolatedAsyncioTestCase):
         await self.win.set_title(new_title='Foo')
         assert await self.win.get_title() == 'Foo'
 
+    async def test_win_set_title_nonblocking(self):
+        async with self.ahk.batch():
+            fut = await self.win.set_title(new_title='Foo', blocking=False)
+        assert await fut.result() is None
+        assert await self.win.get_title() == 'Foo'
+
     async def test_control_send_window(self):
         await self.win.send('Hello World')
         text = await self.win.get_text()
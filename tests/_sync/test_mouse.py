@@ -34,6 +34,15 @@ class TestMouseAsync(TestCase):
         pos2 = self.ahk.get_mouse_position()
         assert pos2 == (200, 200)
 
+    def test_mouse_move_partial(self) -> None:
+        self.ahk.mouse_move(x=100, y=100)
+        self.ahk.mouse_move(x=200)
+        pos = self.ahk.get_mouse_position()
+        assert pos == (200, 100)
+        self.ahk.mouse_move(y=0)
+        pos2 = self.ahk.get_mouse_position()
+        assert pos2 == (200, 0)
+
     def test_mouse_move_rel(self):
         self.ahk.mouse_move(x=100, y=100)
         sleep(0.5)
@@ -56,3 +65,7 @@ class TestMouseAsync(TestCase):
         assert pos != current_pos
         assert pos != (500, 500)
         res.result()
+
+    def test_click_requires_x_and_y(self):
+        with self.assertRaises(AssertionError):
+            self.ahk.click(0)
@@ -58,6 +58,13 @@ class TestWindowAsync(TestCase):
         minmax = self.win.get_minmax()
         assert minmax == 0
 
+    def test_batch(self):
+        with self.ahk.batch():
+            pid = self.ahk.win_get_pid(title='Untitled - Notepad', blocking=False)
+            process_name = self.ahk.win_get_process_name(title='Untitled - Notepad', blocking=False)
+        assert isinstance(pid.result(), int)
+        assert process_name.result() == 'notepad.exe'
+
     def test_win_set_always_on_top(self):
         assert self.win.is_always_on_top() is False
         self.win.set_always_on_top('On')
@@ -106,6 +113,12 @@ class TestWindowAsync(TestCase):
         self.win.set_title(new_title='Foo')
         assert self.win.get_title() == 'Foo'
 
+    def test_win_set_title_nonblocking(self):
+        with self.ahk.batch():
+            fut = self.win.set_title(new_title='Foo', blocking=False)
+        assert fut.result() is None
+        assert self.win.get_title() == 'Foo'
+
     def test_control_send_window(self):
         self.win.send('Hello World')
         text = self.win.get_text()
@@ -0,0 +1,23 @@
+import pytest
+
+from ahk._async.engine import _EMPTY_SUFFIX
+from ahk._async.engine import _image_search_options
+from ahk._async.engine import _window_query_suffix
+
+
+def test_window_query_suffix_validates_every_call() -> None:
+    assert _window_query_suffix(None, None) is _EMPTY_SUFFIX
+    assert _window_query_suffix(True, None) == ('On', '', '')
+    with pytest.raises(TypeError):
+        _window_query_suffix(1, None)  # type: ignore[arg-type]
+    with pytest.raises(ValueError):
+        _window_query_suffix(None, [1])  # type: ignore[arg-type]
+    assert _window_query_suffix(None, (True, 'Fast')) == ('', 'True', 'Fast')  # type: ignore[arg-type]
+    assert _window_query_suffix(None, (1, 'Fast')) == ('', '1', 'Fast')
+
+
+def test_image_search_options_cache_keeps_equal_values_of_different_types_apart() -> None:
+    assert _image_search_options(None, 2, None, None, None) == '*2 '
+    assert _image_search_options(None, 2.0, None, None, None) == '*2.0 '  # type: ignore[arg-type]
+    assert _image_search_options(1, None, None, None, None) == '*Icon1 '
+    assert _image_search_options(True, None, None, None, None) == '*IconTrue '
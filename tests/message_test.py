@@ -5,6 +5,8 @@ from ahk.message import CoordinateResponseMessage
 from ahk.message import ExceptionResponseMessage
 from ahk.message import IntegerResponseMessage
 from ahk.message import NoValueResponseMessage
+from ahk.message import Position
+from ahk.message import PositionResponseMessage
 from ahk.message import RequestMessage
 from ahk.message import ResponseMessage
 from ahk.message import StringResponseMessage
@@ -23,3 +25,29 @@ def test_novalue_response_sentinel() -> None:
     msg = NoValueResponseMessage(raw_content=b'\xee\x80\x80')
     assert msg.unpack() is None
     return None
+
+
+def test_request_message_format() -> None:
+    msg = RequestMessage('AHKWinGetTitle', ['ahk_id 0x1', '', 'On'])
+    assert msg.format() == b'AHKWinGetTitle|YWhrX2lkIDB4MQ==||T24=\n'
+    assert RequestMessage('AHKGetTitleMatchMode').format() == b'AHKGetTitleMatchMode|\n'
+    return None
+
+
+def test_numeric_responses_unpack() -> None:
+    assert CoordinateResponseMessage(raw_content=b'(10, -20)').unpack() == (10, -20)
+    assert PositionResponseMessage(raw_content=b'(1, 2, 300, 400)').unpack() == Position(1, 2, 300, 400)
+    assert IntegerResponseMessage(raw_content=b'42').unpack() == 42
+    assert BooleanResponseMessage(raw_content=b'0').unpack() is False
+    assert BooleanResponseMessage(raw_content=b'1').unpack() is True
+    with pytest.raises(AssertionError):
+        BooleanResponseMessage(raw_content=b'2').unpack()
+    return None
+
+
+def test_response_from_bytes_roundtrip() -> None:
+    msg = StringResponseMessage(raw_content=b'line one\nline two')
+    parsed = ResponseMessage.from_bytes(msg.to_bytes())
+    assert isinstance(parsed, StringResponseMessage)
+    assert parsed.unpack() == 'line one\nline two'
+    return None
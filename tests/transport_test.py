@@ -0,0 +1,205 @@
+import asyncio
+import sys
+import threading
+from typing import Any
+from typing import List
+
+import pytest
+
+from ahk._async.transport import AsyncAHKProcess
+from ahk._async.transport import AsyncDaemonProcessTransport
+from ahk._sync.transport import DaemonProcessTransport
+from ahk._sync.transport import SyncAHKProcess
+from ahk.message import StringResponseMessage
+
+
+class FakeProcess:
+    """
+    Stands in for the AutoHotkey daemon; every request is answered with its own function name
+    """
+
+    def __init__(self) -> None:
+        self._responses: List[bytes] = []
+
+    def write(self, content: bytes) -> None:
+        for line in content.splitlines():
+            function_name = line.split(b'|', 1)[0]
+            self._responses.append(StringResponseMessage(raw_content=function_name).to_bytes())
+
+    def drain_stdin(self) -> None:
+        pass
+
+    def read_response(self) -> bytes:
+        return self._responses.pop(0)
+
+    def kill(self) -> None:
+        pass
+
+
+# answers each request over real pipes, with the daemon's response framing and a response much larger than the request
+FAKE_DAEMON_SCRIPT = '''
+import sys
+type_order_mark = sys.argv[1].encode('ascii')
+for line in sys.stdin.buffer:
+    function_name = line.split(b'|', 1)[0]
+    sys.stdout.buffer.write(type_order_mark + b'\\n0\\n' + function_name * 100 + b'\\n')
+    sys.stdout.buffer.flush()
+'''
+FAKE_DAEMON_ARGS = [sys.executable, '-c', FAKE_DAEMON_SCRIPT, StringResponseMessage._type_order_mark.decode('ascii')]
+
+
+class AsyncFakeProcess(FakeProcess):
+    async def adrain_stdin(self) -> None:
+        pass
+
+    async def read_response(self) -> bytes:  # type: ignore[override]
+        return super().read_response()
+
+
+@pytest.fixture
+def executable_path(tmp_path: Any) -> str:
+    path = tmp_path / 'AutoHotkey.exe'
+    path.touch()
+    return str(path)
+
+
+def test_batch_reads_all_responses_after_a_bad_one(executable_path: str) -> None:
+    class BadResponseProcess(FakeProcess):
+        def write(self, content: bytes) -> None:
+            super().write(content)
+            self._responses = [b'999\n0\nbad' if b'AHKWinGetText' in r else r for r in self._responses]
+
+    transport = DaemonProcessTransport(executable_path=executable_path)
+    transport._proc = BadResponseProcess()  # type: ignore[assignment]
+    transport._started = True
+    with transport.batch():
+        title = transport.function_call('AHKWinGetTitle', ['x'], blocking=False)
+        text = transport.function_call('AHKWinGetText', ['x'], blocking=False)
+        pid = transport.function_call('AHKWinGetPID', ['x'], blocking=False)
+    assert title.result(timeout=5) == 'AHKWinGetTitle'
+    with pytest.raises(ValueError):
+        text.result(timeout=5)
+    assert pid.result(timeout=5) == 'AHKWinGetPID'
+    assert transport.function_call('AHKWinGetClass', ['x']) == 'AHKWinGetClass'
+
+
+def test_batch_does_not_capture_calls_from_other_threads(executable_path: str) -> None:
+    transport = DaemonProcessTransport(executable_path=executable_path)
+    transport._proc = FakeProcess()  # type: ignore[assignment]
+    transport._create_process = FakeProcess  # type: ignore[method-assign, assignment]
+    transport._started = True
+    outside: List[Any] = []
+
+    def call_outside_batch() -> None:
+        outside.append(transport.function_call('AHKWinGetTitle', ['x'], blocking=False))
+        outside.append(transport.function_call('AHKWinGetText', ['x'], blocking=True))
+
+    with transport.batch():
+        inside = transport.function_call('AHKWinGetPID', ['x'], blocking=False)
+        thread = threading.Thread(target=call_outside_batch)
+        thread.start()
+        thread.join()
+        assert outside[0].result(timeout=5) == 'AHKWinGetTitle'
+        assert outside[1] == 'AHKWinGetText'
+        assert not inside._fut.done()
+    assert inside.result(timeout=5) == 'AHKWinGetPID'
+
+
+def test_async_batch_does_not_capture_calls_from_other_tasks(executable_path: str) -> None:
+    async def main() -> None:
+        transport = AsyncDaemonProcessTransport(executable_path=executable_path)
+        transport._proc = AsyncFakeProcess()  # type: ignore[assignment]
+
+        async def create_process() -> AsyncFakeProcess:
+            return AsyncFakeProcess()
+
+        transport._create_process = create_process  # type: ignore[method-assign, assignment]
+        transport._started = True
+        batch_entered = asyncio.Event()
+
+        async def call_outside_batch() -> Any:
+            await batch_entered.wait()
+            fut = await transport.function_call('AHKWinGetTitle', ['x'], blocking=False)
+            return await fut.result()
+
+        outside = asyncio.create_task(call_outside_batch())
+        async with transport.batch():
+            inside = await transport.function_call('AHKWinGetPID', ['x'], blocking=False)
+            batch_entered.set()
+            assert await asyncio.wait_for(outside, timeout=5) == 'AHKWinGetTitle'
+            assert not inside._task.done()
+        assert await inside.result() == 'AHKWinGetPID'
+
+    asyncio.run(main())
+
+
+def test_async_batch_is_closed_for_tasks_that_outlive_it(executable_path: str) -> None:
+    async def main() -> None:
+        transport = AsyncDaemonProcessTransport(executable_path=executable_path)
+        transport._proc = AsyncFakeProcess()  # type: ignore[assignment]
+
+        async def create_process() -> AsyncFakeProcess:
+            return AsyncFakeProcess()
+
+        transport._create_process = create_process  # type: ignore[method-assign, assignment]
+        transport._started = True
+        batch_exited = asyncio.Event()
+
+        async def call_after_batch() -> Any:
+            await batch_exited.wait()
+            fut = await transport.function_call('AHKWinGetTitle', ['x'], blocking=False)
+            return await fut.result()
+
+        async with transport.batch():
+            task = asyncio.create_task(call_after_batch())
+        batch_exited.set()
+        assert await asyncio.wait_for(task, timeout=5) == 'AHKWinGetTitle'
+
+    asyncio.run(main())
+
+
+def test_large_batch_does_not_deadlock_on_full_pipes(executable_path: str) -> None:
+    transport = DaemonProcessTransport(executable_path=executable_path)
+    transport._proc = SyncAHKProcess(runargs=FAKE_DAEMON_ARGS)
+    transport._proc.start()
+    transport._started = True
+    results: List[Any] = []
+
+    def run_batch() -> None:
+        with transport.batch():
+            futures = [transport.function_call('AHKWinGetTitle', ['x' * 100], blocking=False) for _ in range(2000)]
+        results.extend(fut.result() for fut in futures)
+
+    thread = threading.Thread(target=run_batch, daemon=True)
+    try:
+        thread.start()
+        thread.join(timeout=30)
+        assert not thread.is_alive(), 'batch deadlocked'
+        assert results == ['AHKWinGetTitle' * 100] * 2000
+    finally:
+        transport._proc.kill()
+
+
+def test_large_async_batch_does_not_deadlock_on_full_pipes(executable_path: str) -> None:
+    async def main() -> None:
+        transport = AsyncDaemonProcessTransport(executable_path=executable_path)
+        transport._proc = AsyncAHKProcess(runargs=FAKE_DAEMON_ARGS)
+        await transport._proc.start()
+        transport._started = True
+
+        async def run_batch() -> List[Any]:
+            async with transport.batch():
+                futures = [
+                    await transport.function_call('AHKWinGetTitle', ['x' * 100], blocking=False) for _ in range(2000)
+                ]
+            return [await fut.result() for fut in futures]
+
+        try:
+            results = await asyncio.wait_for(run_batch(), timeout=30)
+            assert results == ['AHKWinGetTitle' * 100] * 2000
+        finally:
+            transport._proc.kill()
+            assert transport._proc._proc is not None
+            await transport._proc._proc.wait()
+
+    asyncio.run(main())